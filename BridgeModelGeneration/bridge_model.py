@@ -1,19 +1,175 @@
 import cadquery as cq
+import numpy as np
 from .model_config import BridgeConfig
-from dataclasses import asdict
-from typing import Optional, Dict
+from dataclasses import asdict, fields
+from typing import Optional, Dict, List, Callable
+from collections import OrderedDict
+from functools import lru_cache, cached_property, wraps
 import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+def nary_union(shapes: List[cq.Shape], glue: bool = False) -> cq.Shape:
+    """ Fuse shapes in a single n-ary OCCT boolean.
 
+    All shapes are handed to one BRepAlgoAPI_Fuse as arguments, so the intersections are
+    computed in one pass instead of one boolean (and one new intermediate shape) per solid.
+    With glue=True the fuse runs with BOPAlgo_GlueShift, which skips the general intersection
+    and is only valid for shapes that touch on faces but never overlap in volume.
+    """
+    if not shapes:
+        raise ValueError("nary_union needs at least one shape")
+    if len(shapes) == 1:
+        return shapes[0]
+    return shapes[0].fuse(*shapes[1:], glue=glue).clean()
 
 
+def box_girder_spacing(width_m: float, depth_of_girder: float) -> tuple[int, float]:
+    """ (num_of_cells, box_width) of a box girder deck from its width and girder depth. """
+    ratio = depth_of_girder / width_m
+    if ratio >= 1/6 and ratio <= 1/5:
+        num_of_cells = 1
+    elif ratio < 1/6:
+        num_of_cells = 2
+    else:
+        num_of_cells = 1 # girders deeper than 1/5 of the width still get a single cell
+    box_width = (width_m - 4) / num_of_cells # here 4 is assumed that the l1 that is the length left out on each side of the box should be between 2 to 4 meters
+    return num_of_cells, box_width
+
+
+def centered_positions(count: int, spacing: float) -> np.ndarray:
+    """ Positions of count equally spaced items, centered around the origin. """
+    half_extent = spacing * (count - 1) / 2
+    return np.linspace(-half_extent, half_extent, count)
+
+
+def _pier_stations(num_spans: int, total_length_m: float) -> np.ndarray:
+    """ Pier positions along the length for end spans of 0.7 x the interior span, centered on x = 0. """
+    # plain Python on purpose: numba's round(x, 1) is not correctly rounded like Python's, and the
+    # stations would then move by 0.1 m depending on whether numba is installed
+    interior_span_length = round(total_length_m / (num_spans - 0.6), 1)
+    end_span_length = round(interior_span_length * 0.7, 1)
+
+    stations = []
+    position = 0.0
+    for span in [end_span_length] + [interior_span_length] * (num_spans - 2):
+        position += span
+        stations.append(round(round(position, 1) - total_length_m / 2, 1))
+    return np.array(stations)
+
+
+def _pier_grid(num_x: int, num_y: int, positions_x: np.ndarray, spacing_y: float) -> tuple[np.ndarray, np.ndarray]:
+    """ Flat x and y coordinates of a num_x by num_y pier grid, centered across the width. """
+    # plain NumPy, the grid has a few dozen entries at most, so a jitted kernel only cost every worker a compile
+    return np.repeat(positions_x, num_y), np.tile(centered_positions(num_y, spacing_y), num_x)
+
+
+def place(template: cq.Shape, x: float, y: float, z: float) -> cq.Shape:
+    """ Place a copy of a template solid by location only, without rebuilding its topology. """
+    return template.moved(cq.Location(cq.Vector(x, y, z)))
+
+
+class BoundingBoxes:
+    """ Bounding boxes of a group of solids, used to test new solids for overlap. """
+
+    def __init__(self):
+        self.boxes: List[cq.BoundBox] = []
+
+    def add(self, bbox: cq.BoundBox) -> None:
+        self.boxes.append(bbox)
+
+    def extend(self, other: "BoundingBoxes") -> None:
+        self.boxes.extend(other.boxes)
+
+    def overlaps(self, bbox: cq.BoundBox) -> bool:
+        # touching boxes count as overlapping so that adjoining solids still get fused
+        return any(
+            bbox.xmin <= box.xmax and box.xmin <= bbox.xmax
+            and bbox.ymin <= box.ymax and box.ymin <= bbox.ymax
+            and bbox.zmin <= box.zmax and box.zmin <= bbox.zmax
+            for box in self.boxes
+        )
+
+
+def fast_union(solids: List[cq.Shape], glue: bool = False) -> cq.Workplane:
+    """ Union solids, but only fuse the ones whose bounding boxes overlap.
+
+    Solids are grouped by bounding box overlap, every group is fused with nary_union
+    and the disjoint groups are combined into a single compound without any boolean.
+    glue is passed on to nary_union.
+    """
+    boxed = [(solid.BoundingBox(), solid) for solid in solids]
+    # sorting by bounding box center keeps spatial neighbours next to each other, so the
+    # fuse arguments of a group start out spatially ordered
+    boxed.sort(key=lambda item: item[0].center.toTuple())
+
+    groups: List[tuple[BoundingBoxes, List[cq.Shape]]] = []
+    for bbox, solid in boxed:
+        boxes = BoundingBoxes()
+        boxes.add(bbox)
+        members = [solid]
+
+        # merge every existing group this solid touches into a new one
+        remaining = []
+        for group_boxes, group_members in groups:
+            if group_boxes.overlaps(bbox):
+                boxes.extend(group_boxes)
+                members = group_members + members
+            else:
+                remaining.append((group_boxes, group_members))
+        groups = remaining + [(boxes, members)]
+
+    if not groups:
+        raise ValueError("fast_union needs at least one solid")
+
+    fused = [nary_union(members, glue) for _, members in groups]
+    if len(fused) == 1:
+        return cq.Workplane("XY").newObject(fused)
+
+    return cq.Workplane("XY").newObject([cq.Compound.makeCompound(fused)])
+
+
+def cached_component(build: Callable[["BridgeModel"], cq.Workplane], maxsize: int = 32) -> Callable[["BridgeModel"], cq.Workplane]:
+    """ Memoise a component builder on the model's config_key (LRU, maxsize entries).
+
+    For the deck and pier builders, which read too many fields (and derived spacings) to pass
+    them as explicit lru_cache arguments like the other _build_* helpers.
+    """
+    cache: "OrderedDict[tuple, cq.Workplane]" = OrderedDict()
+
+    @wraps(build)
+    def wrapper(self: "BridgeModel") -> cq.Workplane:
+        key = self.config_key
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        result = cache[key] = build(self)
+        if len(cache) > maxsize:
+            cache.popitem(last=False)
+        return result
+
+    return wrapper
+
 
 class BridgeModel:
     def __init__(self, config: BridgeConfig):
         self.config = config
+
+    @cached_property
+    def config_key(self) -> tuple:
+        """ Every config field except bridge_id, so identical bridges share cached components. """
+        return tuple(getattr(self.config, field.name) for field in fields(self.config) if field.name != "bridge_id")
+
+    @classmethod
+    def for_config(cls, config: BridgeConfig) -> "BridgeModel":
+        """ Return a model specialised for the bridge and pier type of the config.
+
+        The specialised classes bind make_deck / make_piers directly to the matching builders,
+        so they skip the type dispatch. Unknown combinations fall back to the generic model.
+        """
+        model_cls = SPECIALISED_MODELS.get((config.bridge_type, config.pier_type), cls)
+        return model_cls(config)
         
 
     def make_deck(self) -> cq.Workplane:
@@ -34,14 +190,16 @@ class BridgeModel:
 
     def compute_box_girder_spacing(self) -> tuple[int, float]:
         
-        ratio = self.config.depth_of_girder / self.config.width_m
-        if ratio >= 1/6 and ratio <= 1/5:
-            num_of_cells = 1
-        elif ratio < 1/6:
-            num_of_cells = 2
-        box_width = (self.config.width_m - 4) / num_of_cells # here 4 is assumed that the l1 that is the length left out on each side of the box should be between 2 to 4 meters
-        return num_of_cells, box_width
+        return box_girder_spacing(self.config.width_m, self.config.depth_of_girder)
 
+    @cached_property
+    def box_spacing(self) -> tuple[int, float]:
+        """ (num_of_cells, box_width) shared by the deck and the hammer head piers, computed once per model. """
+        if self.config.bridge_type == "box_girder":
+            return self.compute_box_girder_spacing()
+        return 1, self.config.width_m
+
+    @cached_component
     def make_box_girder_deck(self) -> cq.Workplane:
         """ This makes deck with box girders"""
         
@@ -54,9 +212,9 @@ class BridgeModel:
 
 
         # Basic geometric assumptions (meters)
-        top_slab_thk = getattr(self.config, "top_slab_thk", 0.20)
-        bottom_slab_thk = getattr(self.config, "bottom_slab_thk", 0.15)
-        web_thk = getattr(self.config, "web_thk", 0.5)
+        top_slab_thk = self.config.top_slab_thk
+        bottom_slab_thk = self.config.bottom_slab_thk
+        web_thk = self.config.web_thk
 
         ratio = total_width / depth_of_girder
         # logger.info(f"Ratio: {ratio}")
@@ -68,7 +226,7 @@ class BridgeModel:
         #logger.info(f"Box depth: {depth_of_girder}")
         
         
-        num_cells, box_width = self.compute_box_girder_spacing()
+        num_cells, box_width = self.box_spacing
         inner_cell_width = box_width - 2 * web_thk # because we are subtracting from the total box width the web thickness on both sides
         outer_cell_height = self.config.depth_of_girder
         inner_cell_height = outer_cell_height - top_slab_thk - bottom_slab_thk
@@ -78,47 +236,54 @@ class BridgeModel:
             .box(total_width, top_slab_thk, deck_length, centered=(True, False, True)))
 
 
-        boxes = cq.Workplane("YZ")
-        #logger.info(f"total width: {total_width}")
-        
-        for i in range(num_cells):
-
-            box_center_y = - ((num_cells - 1) * box_width / 2) + box_width * i  
-            #logger.info(f"Box center y: {box_center_y}")
-            
+        def rect_wire(y_min: float, y_max: float, z_min: float, z_max: float) -> cq.Wire:
+            # closed YZ rectangle at the start of the deck
+            corners = [(y_min, z_min), (y_max, z_min), (y_max, z_max), (y_min, z_max), (y_min, z_min)]
+            return cq.Wire.makePolygon([cq.Vector(-deck_length/2, y, z) for y, z in corners])
 
-            # outer shell
-            outer = cq.Workplane("YZ").box(box_width, outer_cell_height, deck_length, centered=(True, True, True)).translate((0, box_center_y, -depth_of_girder/2))
-            inner = cq.Workplane("YZ").box(inner_cell_width, inner_cell_height, deck_length, centered=(True, True, True)).translate((0, box_center_y, -depth_of_girder/2))
-            shell = outer.cut(inner)
-            
-            boxes = boxes.union(shell)
+        # the outer cells tile along y without gaps, so together they are one rectangle under the slab,
+        # and every inner cell is a hole in it. The cells are one face with holes extruded once, so
+        # neither a fuse of the cells nor a cut of the inner cells is needed
+        outer_width = num_cells * box_width
+        outer_wire = rect_wire(-outer_width/2, outer_width/2, -depth_of_girder/2 - outer_cell_height/2, -depth_of_girder/2 + outer_cell_height/2)
 
-        # now we need to make the haunches on the outer edges of the boxes
-        p1 = (box_width, -inner_edge_haunch)
+        #logger.info(f"total width: {total_width}")
+        
+        inner_wires = [
+            rect_wire(box_center_y - inner_cell_width/2, box_center_y + inner_cell_width/2, -depth_of_girder/2 - inner_cell_height/2, -depth_of_girder/2 + inner_cell_height/2)
+            for box_center_y in centered_positions(num_cells, box_width)
+        ]
+        box_cells = cq.Solid.extrudeLinear(outer_wire, inner_wires, cq.Vector(deck_length, 0, 0))
+
+        # now we need to make the haunches on the outer edges of the boxes, from the outer web to the deck edge
+        p1 = (outer_width/2, -inner_edge_haunch)
         p2 = (self.config.width_m/2, -inner_edge_haunch + outer_edge_haunch)
         p3 = (p2[0], 0)
         p4 = (p1[0], 0)
 
         points = [p1, p2, p3, p4]
+        mirrored_points = [(-y, z) for y, z in points]
 
-        haunch = cq.Workplane("YZ").polyline(points).close().extrude(deck_length).translate((-deck_length/2, 0, 0))
-        haunch_mirror = haunch.mirror("ZX")
-        haunch = haunch.union(haunch_mirror)
-        boxes = boxes.union(haunch)
+        # both haunches are sketched directly instead of mirroring a copy
+        haunch = cq.Workplane("YZ").polyline(points).close().extrude(deck_length).translate((-deck_length/2, 0, 0)).val()
+        haunch_mirror = cq.Workplane("YZ").polyline(mirrored_points).close().extrude(deck_length).translate((-deck_length/2, 0, 0)).val()
 
-        bridge_core = top_slab.union(boxes)
+        # one n-ary fuse of the slab, the hollow cells and both haunches. The cells end at z = 0 under the
+        # slab and the haunches lie between the outer webs and the deck edges under the slab, so the parts
+        # only share faces and never overlap; that is what the glued fuse requires
+        bridge_core = top_slab.val().fuse(box_cells, haunch, haunch_mirror, glue=True).clean()
 
-        return bridge_core
+        return cq.Workplane("YZ").newObject([bridge_core])
 
     
 
+    @cached_component
     def make_beam_slab_deck(self) -> cq.Workplane:
         """ This makes beam slab or more like Tee girders """
 
         deck_length = self.config.total_length_m
         width = self.config.width_m
-        deck_thickness = getattr(self.config, "deck_thickness", 0.3)
+        deck_thickness = self.config.deck_thickness
         depth_of_girder = self.config.depth_of_girder
 
         girder_thickness = 0.5
@@ -130,187 +295,224 @@ class BridgeModel:
         ratio = width / depth_of_girder
         #logger.info(f"Ratio: {ratio}")
 
-        deck_slab = cq.Workplane("XY").box(deck_length, width, deck_thickness, centered=(True, True, False))
-        
-        girders = cq.Workplane("YZ")
-        for i in range(num_of_girders):
-            girder_y_position = -(girder_distance * (num_of_girders - 1) / 2)  + girder_distance * i
-            girder = cq.Workplane("YZ").rect(girder_thickness, -depth_of_girder, centered=(True, False)).extrude(deck_length)
-            
-            girder = girder.translate((-deck_length / 2, girder_y_position , 0)) # remember tranlsation always happens in global coordinates so x, y, z.
-            girders = girders.union(girder)
-
-        
-        bridge_core = (
-            deck_slab.union(girders)
-            .faces("-Z")          # bottom faces
-            .edges("|X")          # edges parallel to Y (girder webs)
-            .chamfer(chamfer_radius)
-        )
+        # The bottom edges along X are chamfered in the 2D profile, so no edge selection and
+        # chamfer has to run on the solid: the slab loses its two bottom corners, every
+        # girder its two bottom corners, and gains the (concave) chamfer where its web meets the slab.
+        c = chamfer_radius
+        half_width = width / 2
+        half_girder = girder_thickness / 2
+        girder_profile = [
+            (-half_girder - c, 0), (-half_girder, -c), (-half_girder, -depth_of_girder + c), (-half_girder + c, -depth_of_girder),
+            (half_girder - c, -depth_of_girder), (half_girder, -depth_of_girder + c), (half_girder, -c), (half_girder + c, 0),
+        ]
+
+        # The slab and the girders form one T-beam cross-section: its underside runs left to right and
+        # dips into every girder on the way. The whole deck is then a single extrusion without any boolean.
+        underside = [(girder_y_position + y, z) for girder_y_position in centered_positions(num_of_girders, girder_distance) for y, z in girder_profile]
+        deck_profile = [(-half_width + c, 0), *underside, (half_width - c, 0), (half_width, c), (half_width, deck_thickness), (-half_width, deck_thickness), (-half_width, c)]
+
+        # closed YZ profile at the start of the deck, extruded over the full deck length
+        wire = cq.Wire.makePolygon([cq.Vector(-deck_length / 2, y, z) for y, z in deck_profile + deck_profile[:1]])
+        bridge_core = cq.Workplane("XY").newObject([cq.Solid.extrudeLinear(wire, [], cq.Vector(deck_length, 0, 0))])
         
         return bridge_core
         
     def make_approach_slabs(self) -> Optional[cq.Workplane]:
 
-        approach_slab_thickness = self.config.deck_thickness
-        approach_slab_width = self.config.width_m
+        return self._build_approach_slabs(self.config.width_m, self.config.total_length_m, self.config.deck_thickness)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _build_approach_slabs(width_m: float, total_length_m: float, deck_thickness: float) -> cq.Workplane:
+
+        approach_slab_thickness = deck_thickness
+        approach_slab_width = width_m
         approach_slab_length = 10.0
-        approach_slab = cq.Workplane("XY").box(approach_slab_length, approach_slab_width, approach_slab_thickness, centered=(False, True, False))
-        approach_slab = approach_slab.translate((self.config.total_length_m/2, 0, 0))
-        approach_slab_mirror = approach_slab.mirror("YZ")
-        approach_slab = approach_slab.union(approach_slab_mirror)
-        return approach_slab
+        approach_slab = cq.Solid.makeBox(approach_slab_length, approach_slab_width, approach_slab_thickness, pnt=cq.Vector(0, -approach_slab_width/2, 0))
+        # one slab behind each end of the deck
+        return fast_union([
+            place(approach_slab, total_length_m/2, 0, 0),
+            place(approach_slab, -total_length_m/2 - approach_slab_length, 0, 0),
+        ])
 
     def make_railings(self) -> Optional[cq.Workplane]:
         """ this makes the railings for the bridge if safety is required"""
         """ this can return None if safety is not required"""
 
+        return self._build_railings(self.config.width_m, self.config.total_length_m, self.config.deck_thickness)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _build_railings(width_m: float, total_length_m: float, deck_thickness: float) -> cq.Workplane:
+
         railing_pole_height = 1.0 # this is taken from RZ standards
         railing_pole_distance = 2.5
         railing_pole_side_length = 0.07 # this is assuming that the pole is a square in xy plane with 7 cm side length
-        deck_length = self.config.total_length_m 
+        deck_length = total_length_m 
         
 
         num_of_poles = max(2, int(deck_length / (railing_pole_distance)))
         
 
-        railing_poles = cq.Workplane("XY")
+        railing_y_position = width_m / 2 - railing_pole_side_length / 2
 
         # we can take the distance between the 1st pole and the last pole to get the total length of the bar which would be less than the span length. 
         # easy way is to just minus the distance of half poles from both sides.
 
-
-        for i in range(num_of_poles):
-            pole_x_position = - ( railing_pole_distance * (num_of_poles - 1) /2) + railing_pole_distance * i
-            pole = cq.Workplane("XY").box(railing_pole_side_length, railing_pole_side_length, railing_pole_height, centered=(True, True, False)).translate((pole_x_position, self.config.width_m / 2 - railing_pole_side_length / 2, self.config.deck_thickness))
-            railing_poles = railing_poles.union(pole)
-
-        
-        railing_poles_mirror = railing_poles.mirror("XZ")
-        railing_poles = railing_poles.union(railing_poles_mirror)
-
+        pole_x_positions = centered_positions(num_of_poles, railing_pole_distance)
 
         # now we add railing bars between the poles
-
         num_of_bars = 3
         distance_between_bars = railing_pole_height / num_of_bars
-        bars = cq.Workplane("XY")
-        for i in range(num_of_bars):
-            bar_z_position = distance_between_bars * (i + 1)
-            bar = cq.Workplane("XY").box(deck_length - railing_pole_distance, railing_pole_side_length, railing_pole_side_length, centered=(True, True, True)).translate((0, self.config.width_m / 2 - railing_pole_side_length / 2, bar_z_position  + self.config.deck_thickness))
-            bars = bars.union(bar)
-        
-        bars_mirror = bars.mirror("XZ")
-        bars = bars.union(bars_mirror)
+        bar_z_positions = distance_between_bars * np.arange(1, num_of_bars + 1) + deck_thickness
+
+        # both sides are sketched directly at +y and -y instead of mirroring a copy
+        railing_parts = []
+        for side_y in (railing_y_position, -railing_y_position):
+
+            # all poles share the deck top plane, so one sketch with every pole footprint is extruded once
+            railing_poles = (
+                cq.Workplane("XY", origin=(0, 0, deck_thickness))
+                .pushPoints([(pole_x_position, side_y) for pole_x_position in pole_x_positions])
+                .rect(railing_pole_side_length, railing_pole_side_length)
+                .extrude(railing_pole_height)
+            )
+            bars = (
+                cq.Workplane("YZ")
+                .pushPoints([(side_y, bar_z_position) for bar_z_position in bar_z_positions])
+                .rect(railing_pole_side_length, railing_pole_side_length)
+                .extrude((deck_length - railing_pole_distance) / 2, both=True)
+            )
+            railing_parts.extend([railing_poles.findSolid(), bars.findSolid()])
 
-        return railing_poles.union(bars)
+        # the two sides never touch, so only poles and bars of the same side get fused
+        return fast_union(railing_parts)
 
-    def compute_pier_positions_along_length(self) -> list[float]:
+    def compute_pier_positions_along_length(self) -> np.ndarray:
         
-        num_of_spans= self.config.num_spans
-        interior_span_length = round(self.config.total_length_m / (num_of_spans - 0.6), 1)
-        end_span_length = round(interior_span_length * 0.7, 1)
+        # piers sit at the running sum of the spans, shifted so the bridge is centered on x = 0
+        return _pier_stations(self.config.num_spans, float(self.config.total_length_m))
 
-        #create a list of spans
-        spans = [end_span_length] + [interior_span_length] * (num_of_spans-2) + [end_span_length]
-        pier_positions = []
-        pos = 0.0
-        for span in spans[:-1]:
-            pos += span
 
-            pier_positions.append(round(pos, 1))
+    def make_piers(self) -> Optional[cq.Workplane]:
+
+        if self.config.pier_type == "multicolumn":
+            return self.make_multicolumn_piers()
+        elif self.config.pier_type == "hammer_head":
+            return self.make_hammer_head_piers()
+        else:
+            raise ValueError(f"Invalid pier type: {self.config.pier_type}")
+
+    @cached_component
+    def make_multicolumn_piers(self) -> cq.Workplane:
+        """ Columns across the width under a shared prismatic pier cap at every pier station """
+
+        bridge_clearance_height = self.config.bridge_clearance_height # this is the minimum clearance height from the girder to the ground
+
+        # config fields read below, bound once as locals
+        width_m = self.config.width_m
+        depth_of_girder = self.config.depth_of_girder
+        radius_of_pier = self.config.radius_of_pier
+        pier_cross_section = self.config.pier_cross_section
+         
+    
+        # num of piers in x direction is same for both types of piers
+        num_of_piers_x = self.config.number_of_piers_along_length # this is the number of piers in the x direction
+        pier_positions_x = self.compute_pier_positions_along_length() 
 
-        normalised_pier_positions = [round(p - (self.config.total_length_m / 2), 1) for p in pier_positions]
+        num_of_piers_y = self.config.number_of_piers_across_width
+        pier_spacing_y = width_m / num_of_piers_y
+        pier_grid_x, pier_grid_y = _pier_grid(num_of_piers_x, num_of_piers_y, pier_positions_x, pier_spacing_y)
         
-        return normalised_pier_positions
 
+        # Multi column piers require a pier cap
+        pier_parts = []
+        cap_height = 0.5     # Right now assuming that the cap height is 1 meter
+        cap_thickness = radius_of_pier * 2
+
+
+        # Every column and cap is identical, so they are built once and placed
+        if pier_cross_section == "circular":
+            column_template = cq.Solid.makeCylinder(radius_of_pier, bridge_clearance_height, pnt=cq.Vector(0, 0, -bridge_clearance_height))
+        elif pier_cross_section == "rectangular":
+            column_template = cq.Solid.makeBox(radius_of_pier, radius_of_pier, bridge_clearance_height, pnt=cq.Vector(-radius_of_pier/2, -radius_of_pier/2, -bridge_clearance_height))
+        cap_template = self.make_prismatic_pier_caps(cap_height, cap_thickness).val()
+
+        # Generating piers columns
+        column_top_z = - depth_of_girder - cap_height
+        for pier_position_x, pier_position_y in zip(pier_grid_x, pier_grid_y):
+            pier = place(column_template, pier_position_x, pier_position_y, column_top_z)
+            pier_parts.append(pier)
+        for pier_position_x in pier_positions_x[:num_of_piers_x]:
+            pier_cap = place(cap_template, pier_position_x, 0, column_top_z)
+            pier_parts.append(pier_cap)
+        # columns and caps only meet on their end faces
+        piers = fast_union(pier_parts, glue=True)
 
-    def make_piers(self) -> Optional[cq.Workplane]:
+        return piers
+
+    @cached_component
+    def make_hammer_head_piers(self) -> cq.Workplane:
+        """ A column with a hammer head cap under every box girder cell at every pier station """
 
+        bridge_clearance_height = self.config.bridge_clearance_height # this is the minimum clearance height from the girder to the ground
 
-        bridge_clearance_height = getattr(self.config, "bridge_clearance_height", 5.0) # this is the minimum clearance height from the girder to the ground
+        # config fields read below, bound once as locals
+        width_m = self.config.width_m
+        depth_of_girder = self.config.depth_of_girder
+        radius_of_pier = self.config.radius_of_pier
+        pier_cross_section = self.config.pier_cross_section
          
     
         # num of piers in x direction is same for both types of piers
         num_of_piers_x = self.config.number_of_piers_along_length # this is the number of piers in the x direction
         pier_positions_x = self.compute_pier_positions_along_length() 
 
-        if self.config.pier_type == "multicolumn":
-            
-            
-            
-            num_of_piers_y = self.config.number_of_piers_across_width
-            pier_spacing_y = self.config.width_m / num_of_piers_y
-            
-
-            # Multi column piers require a pier cap
-            piers = cq.Workplane("XY")
-            pier_caps = cq.Workplane("XY")
-            cap_height = 0.5     # Right now assuming that the cap height is 1 meter
-            cap_thickness = self.config.radius_of_pier * 2
-
-
-            # Generating piers columns
-            for i in range(num_of_piers_x):
-                pier_position_x = pier_positions_x[i]
-                for j in range(num_of_piers_y):
-                    pier_position_y = -((pier_spacing_y) * (num_of_piers_y - 1)/2) + pier_spacing_y * j
-                    if self.config.pier_cross_section == "circular":
-                        pier = cq.Workplane("XY").circle(self.config.radius_of_pier).extrude(-bridge_clearance_height).translate((pier_position_x, pier_position_y, - self.config.depth_of_girder - cap_height))
-                    elif self.config.pier_cross_section == "rectangular":
-                        pier = cq.Workplane("XY").rect(self.config.radius_of_pier, self.config.radius_of_pier).extrude(-bridge_clearance_height).translate((pier_position_x, pier_position_y, - self.config.depth_of_girder - cap_height))
-                    piers = piers.union(pier)
-                pier_cap = self.make_prismatic_pier_caps(cap_height, cap_thickness).translate((pier_position_x, 0, -self.config.depth_of_girder - cap_height))
-                pier_caps = pier_caps.union(pier_cap)
-            piers = piers.union(pier_caps)
+        pier_parts = []
+        num_of_piers_y = self.config.number_of_piers_across_width
+        _, box_width = self.box_spacing
+        pier_spacing_y = width_m / num_of_piers_y # this is to calculate the spacing between the piers accross the width of the bridge. This will be the same as the spacing between the cells in the box girder.
+        pier_grid_x, pier_grid_y = _pier_grid(num_of_piers_x, num_of_piers_y, pier_positions_x, pier_spacing_y)
+
+        #Creating polygon geometry for hammer head piers
+        polygon_height = 1 # Literature based. Check notion repository for more details.
+        polygon_slant_height = 1 # Literature based. Check notion repository for more details.
+        if pier_cross_section == "circular":
+            polygon_lower_width = 2*radius_of_pier
+        elif pier_cross_section == "rectangular":
+            polygon_lower_width = 1.8 # this is in case of rectangular piers for hammerhead. from literature. Check notion repository for more details.
         
-
-        if self.config.pier_type == "hammer_head":
-
-
-            piers = cq.Workplane("YZ")
-            num_of_piers_y = self.config.number_of_piers_across_width
-            _, box_width = self.compute_box_girder_spacing()
-            pier_spacing_y = self.config.width_m / num_of_piers_y # this is to calculate the spacing between the piers accross the width of the bridge. This will be the same as the spacing between the cells in the box girder.
-
-            #Creating polygon geometry for hammer head piers
-            polygon_height = 1 # Literature based. Check notion repository for more details.
-            polygon_slant_height = 1 # Literature based. Check notion repository for more details.
-            if self.config.pier_cross_section == "circular":
-                polygon_lower_width = 2*self.config.radius_of_pier
-            elif self.config.pier_cross_section == "rectangular":
-                polygon_lower_width = 1.8 # this is in case of rectangular piers for hammerhead. from literature. Check notion repository for more details.
-            
-            p1 = (box_width/2, 0)
-            p2 = (p1[0], - polygon_height)
-            p3 = (polygon_lower_width/2, -polygon_slant_height - polygon_height)
-            p4 = (0, p3[1])
-            p5 = (0 , 0)
-            cap_height = polygon_height + polygon_slant_height # this will be the height that is the sum of two lines one straigt and one slanted.
-            pier_thickness = 1.0 # assumed thickness of the pier column
-
-            points = [p1, p2, p3, p4, p5]
-            for i in range(num_of_piers_x):
-                pier_position_x = pier_positions_x[i]
-                for j in range(num_of_piers_y):
-                    # we will calculate the piers accross the width of the bridge
-                    pier_position_y = -((pier_spacing_y) * (num_of_piers_y - 1)/2) + pier_spacing_y * j
-
-                    # first making rectungular column
-                    if self.config.pier_cross_section == "circular":
-                        pier_column = cq.Workplane("XY").circle(self.config.radius_of_pier).extrude(-bridge_clearance_height)
-                    elif self.config.pier_cross_section == "rectangular":
-                        pier_column = cq.Workplane("YZ").rect(polygon_lower_width, -bridge_clearance_height).extrude(pier_thickness, both=True)
-                   
-                    pier_column = pier_column.translate((pier_position_x, pier_position_y, - self.config.depth_of_girder - cap_height ))
-
-                    # then making the hammer head shape ( pier cap)
-                    pier_cap = cq.Workplane("YZ").polyline(points).close().extrude(pier_thickness, both=True)
-                    pier_cap_mirror = pier_cap.mirror("XZ")
-                    pier_cap = pier_cap.union(pier_cap_mirror)
-                    pier_cap = pier_cap.translate((pier_position_x, pier_position_y, - self.config.depth_of_girder ))
-                    piers = piers.union(pier_column)
-                    piers = piers.union(pier_cap)
+        p1 = (box_width/2, 0)
+        p2 = (p1[0], - polygon_height)
+        p3 = (polygon_lower_width/2, -polygon_slant_height - polygon_height)
+        p4 = (0, p3[1])
+        p5 = (0 , 0)
+        cap_height = polygon_height + polygon_slant_height # this will be the height that is the sum of two lines one straigt and one slanted.
+        pier_thickness = 1.0 # assumed thickness of the pier column
+
+        points = [p1, p2, p3, p4, p5]
+
+        # first making rectungular column
+        if pier_cross_section == "circular":
+            column_template = cq.Solid.makeCylinder(radius_of_pier, bridge_clearance_height, pnt=cq.Vector(0, 0, -bridge_clearance_height))
+        elif pier_cross_section == "rectangular":
+            # centered on its origin in all three directions, like the rect extruded both ways it replaces
+            column_template = cq.Solid.makeBox(2 * pier_thickness, polygon_lower_width, bridge_clearance_height, pnt=cq.Vector(-pier_thickness, -polygon_lower_width/2, -bridge_clearance_height/2))
+
+        # then making the hammer head shape ( pier cap)
+        pier_cap = cq.Workplane("YZ").polyline(points).close().extrude(pier_thickness, both=True).val()
+        pier_cap_mirror = cq.Workplane("YZ").polyline([(-y, z) for y, z in points]).close().extrude(pier_thickness, both=True).val()
+        cap_template = nary_union([pier_cap, pier_cap_mirror], glue=True)  # the halves share the y = 0 face
+
+        column_top_z = - depth_of_girder - cap_height
+        for pier_position_x, pier_position_y in zip(pier_grid_x, pier_grid_y):
+            pier_column = place(column_template, pier_position_x, pier_position_y, column_top_z)
+            pier_cap = place(cap_template, pier_position_x, pier_position_y, - depth_of_girder )
+            pier_parts.append(pier_column)
+            pier_parts.append(pier_cap)
+        # caps of neighbouring columns can overlap when there are more columns than box cells,
+        # so this keeps the general fuse
+        piers = fast_union(pier_parts)
 
         return piers
         
@@ -320,30 +522,47 @@ class BridgeModel:
      
         """ This makes the prismatic pier caps """
 
-        cap_width = self.config.width_m     # width along traffic
+        return self._build_prismatic_pier_caps(self.config.width_m, cap_height, cap_thickness)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _build_prismatic_pier_caps(width_m: float, cap_height: float, cap_thickness: float) -> cq.Workplane:
+
+        cap_width = width_m     # width along traffic
         pier_cap = cq.Workplane("YZ").box(cap_width, cap_height, cap_thickness, centered=(True, False, True))
         return pier_cap
         
     def make_wing_walls(self) -> Optional[cq.Workplane]:
         """Create wing walls if not missing."""
 
+        return self._build_wing_walls(
+            self.config.width_m,
+            self.config.total_length_m,
+            self.config.depth_of_girder,
+            self.config.bridge_clearance_height,
+            self.config.wing_wall_thickness,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _build_wing_walls(width_m: float, total_length_m: float, depth_of_girder: float, bridge_clearance_height: float, wing_wall_thickness: float) -> cq.Workplane:
+
         # Geometric parameters (in meters)
-        wing_wall_thickness = getattr(self.config, "wing_wall_thickness", 0.5)
-        bridge_seating_height = self.config.depth_of_girder
+        bridge_seating_height = depth_of_girder
         bridge_seating_width = 2
-        wing_wall_cap_height = 0.5 * self.config.bridge_clearance_height
+        wing_wall_cap_height = 0.5 * bridge_clearance_height
         wing_wall_top_length = 4.0
         wing_wall_bottom_length = 2.0
-        wing_wall_side_length = self.config.bridge_clearance_height
+        wing_wall_side_length = bridge_clearance_height
 
-        deck_length = self.config.total_length_m
-        deck_width = self.config.width_m
+        deck_length = total_length_m
+        deck_width = width_m
 
         wing_wall_slab_slot_length = bridge_seating_width
         wing_wall_slot_height = bridge_seating_height
 
         x_origin = deck_length / 2 - bridge_seating_width
-        z_origin = - self.config.bridge_clearance_height - self.config.depth_of_girder
+        z_origin = - bridge_clearance_height - depth_of_girder
         # Define points for the wing wall profile in the XZ-plane
         p1 = (x_origin, z_origin)
         p2 = (x_origin + wing_wall_bottom_length, z_origin)
@@ -366,68 +585,81 @@ class BridgeModel:
         p7 = (x_origin, z_origin + wing_wall_side_length)
 
         points = [p1, p2, p3, p4, p5, p6, p7]
+        # profile of the walls at the other end of the bridge, sketched directly instead of mirrored
+        mirrored_points = [(-x, z) for x, z in points]
 
-        def create_wing_wall(translate_y: float, thickness: float, mirror_yz: bool = False) -> cq.Workplane:
-            wall = (
-                cq.Workplane("XZ")
-                .polyline(points)
-                .close()
-                .extrude(thickness)
-                .translate((0, translate_y, 0))
-            )
-            if mirror_yz:
-                wall = wall.mirror("YZ")
-            return wall
-
-        left_front = create_wing_wall(deck_width / 2, wing_wall_thickness, mirror_yz=False)
-        right_front = create_wing_wall(-deck_width / 2, -wing_wall_thickness, mirror_yz=False)
-        left_back = create_wing_wall(deck_width / 2, wing_wall_thickness, mirror_yz=True)
-        right_back = create_wing_wall(-deck_width / 2, -wing_wall_thickness, mirror_yz=True)
-
-        wing_walls = (
-            left_front
-            .union(right_front)
-            .union(left_back)
-            .union(right_back)
-        )
+        # one profile wire and one extrusion per bridge end; the wall spans y in [-t, 0] like
+        # Workplane("XZ").extrude(t) (the XZ normal is -Y), so both sides are placed copies of it
+        def profile_wire(profile: List[tuple[float, float]]) -> cq.Wire:
+            # closed polygon in the XZ plane, built directly instead of through a Workplane sketch
+            return cq.Wire.makePolygon([cq.Vector(x, 0, z) for x, z in profile + profile[:1]])
+
+        front_wall = cq.Solid.extrudeLinear(profile_wire(points), [], cq.Vector(0, -wing_wall_thickness, 0))
+        back_wall = cq.Solid.extrudeLinear(profile_wire(mirrored_points), [], cq.Vector(0, -wing_wall_thickness, 0))
 
-        return wing_walls
+        left_y = deck_width / 2
+        right_y = -deck_width / 2 + wing_wall_thickness
+
+        # the four walls are disjoint, so they are collected into one compound without booleans
+        return fast_union([
+            place(front_wall, 0, left_y, 0),
+            place(front_wall, 0, right_y, 0),
+            place(back_wall, 0, left_y, 0),
+            place(back_wall, 0, right_y, 0),
+        ])
 
     def make_back_walls(self) -> Optional[cq.Workplane]:
 
-        back_wall_thickness = 2
-        back_wall = cq.Workplane("YZ").box(
-            self.config.width_m - 2 * self.config.wing_wall_thickness,
+        return self._build_back_walls(
+            self.config.width_m,
+            self.config.total_length_m,
+            self.config.depth_of_girder,
             self.config.bridge_clearance_height,
-            back_wall_thickness,
-            centered=(True, False, False)
-        ).translate((self.config.total_length_m/2 - back_wall_thickness, 0, -self.config.depth_of_girder - self.config.bridge_clearance_height))       
-        # Back retaining wall
-        wall_mirror = back_wall.mirror("YZ")  
+            self.config.wing_wall_thickness,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _build_back_walls(width_m: float, total_length_m: float, depth_of_girder: float, bridge_clearance_height: float, wing_wall_thickness: float) -> cq.Workplane:
+
+        back_wall_thickness = 2
+        thinner_wall_thickness = 0.5
+        base_z = -depth_of_girder - bridge_clearance_height
+
+        wall_width = width_m - 2 * wing_wall_thickness
+
+        # Back retaining wall, placed at both ends instead of mirroring a copy
+        back_wall = cq.Solid.makeBox(back_wall_thickness, wall_width, bridge_clearance_height, pnt=cq.Vector(0, -wall_width/2, 0))
     
         
         # this adds a thinner wall at the end of back wall to close the end of girders.
-        thinner_wall = cq.Workplane("YZ").box(self.config.width_m - 2 * self.config.wing_wall_thickness, self.config.bridge_clearance_height + self.config.depth_of_girder, 0.5, centered=(True, False, False))
-        thinner_wall = thinner_wall.translate((self.config.total_length_m/2, 0, -self.config.bridge_clearance_height - self.config.depth_of_girder))    
-        thinner_wall_mirror = thinner_wall.mirror("YZ")
-        thinner_wall_combined = thinner_wall.union(thinner_wall_mirror)
+        thinner_wall = cq.Solid.makeBox(thinner_wall_thickness, wall_width, bridge_clearance_height + depth_of_girder, pnt=cq.Vector(0, -wall_width/2, 0))
         
-        return back_wall.union(wall_mirror).union(thinner_wall_combined)
+        return fast_union([
+            place(back_wall, total_length_m/2 - back_wall_thickness, 0, base_z),
+            place(back_wall, -total_length_m/2, 0, base_z),
+            place(thinner_wall, total_length_m/2, 0, base_z),
+            place(thinner_wall, -total_length_m/2 - thinner_wall_thickness, 0, base_z),
+        ])
 
     
-    def build_bridge(self, with_components: bool = False) -> cq.Workplane | Dict[str, cq.Workplane]:
+    def build_bridge(self, with_components: bool = False, assembly: bool = False) -> cq.Workplane | tuple[Dict[str, cq.Workplane], cq.Workplane]:
         """
         Build the bridge geometry.
 
         Args:
-            as_components: When True, return each component individually instead of a
-                single boolean union.
+            with_components: When True, also return each component individually next to
+                the single boolean union.
+            assembly: When True, the components are only collected into a compound without
+                any boolean fuse. Enough for mesh export, but the result is not one manifold solid.
 
         Returns:
-            Either a combined cq.Workplane or a dict of component solids.
+            Either the combined cq.Workplane or a (dict of component solids, combined
+            cq.Workplane) tuple. The union is computed once in both cases.
         """
-        logger.info(f"****BRIDGE {self.config.bridge_id} type: {self.config.bridge_type}****")
-        logger.info(f"Building bridge {self.config.bridge_id} with config: {asdict(self.config)}")
+        logger.info("****BRIDGE %s type: %s****", self.config.bridge_id, self.config.bridge_type)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Building bridge %s with config: %s", self.config.bridge_id, asdict(self.config))
         
         components: Dict[str, cq.Workplane | None] = {
             "deck": self.make_deck(),
@@ -440,13 +672,17 @@ class BridgeModel:
 
         filtered = {name: solid for name, solid in components.items() if solid is not None}
 
-        bridge: cq.Workplane | None = None
-        for solid in filtered.values():
-            bridge = solid if bridge is None else bridge.union(solid)
-
-        if bridge is None:
+        if not filtered:
             raise ValueError("No bridge components were generated; check configuration.")
 
+        solids = [solid.findSolid() for solid in filtered.values()]
+        if assembly:
+            bridge = cq.Workplane("XY").newObject([cq.Compound.makeCompound(solids)])
+        else:
+            # general fuse: the components do not only share faces, e.g. the rectangular hammer head
+            # columns reach up into the box girder deck, and a glued fuse would count that overlap twice
+            bridge = fast_union(solids)
+
         if with_components:
             return filtered, bridge
         else:
@@ -454,3 +690,24 @@ class BridgeModel:
 
         
        
+
+
+class BeamSlabBridgeModel(BridgeModel):
+    """ Beam-slab deck on multicolumn piers. """
+
+    make_deck = BridgeModel.make_beam_slab_deck
+    make_piers = BridgeModel.make_multicolumn_piers
+
+
+class BoxGirderBridgeModel(BridgeModel):
+    """ Box girder deck on hammer head piers. """
+
+    make_deck = BridgeModel.make_box_girder_deck
+    make_piers = BridgeModel.make_hammer_head_piers
+
+
+# (bridge_type, pier_type) -> specialised model, used by BridgeModel.for_config
+SPECIALISED_MODELS: Dict[tuple[str, str], type[BridgeModel]] = {
+    ("beam_slab", "multicolumn"): BeamSlabBridgeModel,
+    ("box_girder", "hammer_head"): BoxGirderBridgeModel,
+}
@@ -2,7 +2,7 @@ import logging
 from pathlib import Path
 from typing import List, Optional
 import cadquery as cq
-import open3d as o3d
+import numpy as np
 import pandas as pd
 from dataclasses import asdict
 from datetime import datetime
@@ -10,6 +10,9 @@ import time
 import random
 import os
 import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from .model_config import BridgeConfig
 from .param_gen import generate_bridge_configs, configs_to_records
 from .bridge_model import BridgeModel
@@ -18,6 +21,92 @@ from .bridge_model import BridgeModel
 
 logger = logging.getLogger(__name__)
 
+# bump whenever bridge_model geometry or export_obj output changes, so existing OBJs are re-exported
+GEOMETRY_VERSION = 7
+
+
+def _init_worker() -> None:
+    """Configure logging in the worker processes of the export pool."""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+def export_obj(solid: cq.Workplane, obj_file: Path, tolerance: float = 0.1, angular_tolerance: float = 0.5) -> bool:
+    """Tessellate a solid and write it as OBJ directly, without an STL round-trip.
+    The 0.1 m linear deflection bounds the error on the large faces; the angular deflection
+    limits the small-radius ones, so 0.5 rad sets the faceting of the 0.6 m piers
+    (about 13 segments around, against about 63 at 0.1 rad).
+    Returns False if the tessellation produced no vertices."""
+    vertices, triangles = solid.findSolid().tessellate(tolerance, angular_tolerance)
+    if not vertices:
+        return False
+
+    vertices = np.asarray([v.toTuple() for v in vertices], dtype=np.float64)  # OCCT's doubles, as the Open3D writer kept them
+    faces = np.asarray(triangles, dtype=np.int32) + 1 # OBJ indices are 1-based
+    # each block is formatted by one C-level %-format and written with a single call,
+    # np.savetxt would format row by row in Python
+    with open(obj_file, "w") as f:
+        f.write(("v %f %f %f\n" * len(vertices)) % tuple(vertices.ravel().tolist()))
+        f.write(("f %d %d %d\n" * len(faces)) % tuple(faces.ravel().tolist()))
+    return True
+
+
+def _export_key(config: BridgeConfig, include_components: bool, assembly: bool) -> str:
+    """Hash of everything that determines the exported meshes of a bridge."""
+    params = {"config": asdict(config), "include_components": include_components, "assembly": assembly,
+              "geometry_version": GEOMETRY_VERSION}
+    return hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _is_up_to_date(key_file: Path, key: str) -> bool:
+    """True if key_file holds key and every OBJ it lists (one per line after the key) still exists."""
+    lines = key_file.read_text().splitlines() if key_file.exists() else []
+    if not lines:
+        return False
+    stored_key, *outputs = lines
+    return stored_key == key and bool(outputs) and all((key_file.parent / output).exists() for output in outputs)
+
+
+def _build_and_export(config: BridgeConfig, bridge_objects_dir: Path, include_components: bool, assembly: bool = False) -> bool:
+    """Build one bridge model and export it (and optionally its components) as OBJ files.
+    Returns False if a component mesh could not be generated.
+    Bridges whose meshes were already exported with the same parameters are skipped."""
+
+    obj_file = bridge_objects_dir / f"{config.bridge_id}.obj"
+    key_file = bridge_objects_dir / f".{config.bridge_id}.sha1"
+    key = _export_key(config, include_components, assembly)
+    if _is_up_to_date(key_file, key):
+        logger.info("Bridge %s is up to date, skipping export", config.bridge_id)
+        return True
+
+    # Then we build the bridge model from geometry.bridge_model.py
+    bridge_model = BridgeModel.for_config(config)
+
+    # build_bridge always builds every component, so build once and reuse both results
+    components, bridge = bridge_model.build_bridge(with_components=True, assembly=assembly) # this is building the bridge model from geometry.bridge_model.py
+    # the meshes are exported one after another: the bridges already run one per process, and the
+    # fused bridge shares faces with its components, so they must not be tessellated concurrently.
+    # A per-part process pool would avoid the sharing only by serialising every shape to BRep, and
+    # would start processes inside processes that already use every core
+    outputs = [obj_file]
+    if export_obj(bridge, obj_file):
+        logger.info("Successfully saved bridge %s to %s", config.bridge_id, obj_file)
+
+    if include_components:
+        os.makedirs(bridge_objects_dir / f"{config.bridge_id}", exist_ok=True) #making a directory for the bridge id
+
+        for name, component in components.items():
+            component_file = bridge_objects_dir / f"{config.bridge_id}" / f"{name}.obj"
+            if export_obj(component, component_file):
+                logger.info("Successfully saved bridge %s to %s", config.bridge_id, component_file)
+                outputs.append(component_file)
+            else:
+                logger.error("Failed to generate valid mesh for bridge %s", config.bridge_id)
+                return False
+
+    # the key is followed by every written OBJ, so a missing file also triggers a re-export
+    key_file.write_text("\n".join([key, *(output.relative_to(bridge_objects_dir).as_posix() for output in outputs)]) + "\n")
+    return True
+
 
 class BridgePipeline:
     """High-level pipeline orchestrating parameter generation and exports."""
@@ -37,8 +126,10 @@ class BridgePipeline:
         # Track generated bridges
         self.bridge_metadata: List[BridgeConfig] = []
 
-    def generate_bridges(self, num_bridges: int, bridge_type: str, include_components: bool = False, seed: int | None = None) -> List[BridgeConfig]:
-        """Create bridge configs and keep them in-memory."""
+    def generate_bridges(self, num_bridges: int, bridge_type: str, include_components: bool = False, seed: int | None = None, max_workers: int | None = None, assembly: bool = False) -> List[BridgeConfig]:
+        """Create bridge configs and keep them in-memory.
+        The bridges are built and exported in parallel with max_workers processes (default: one per CPU).
+        With assembly=True the exported bridge is a compound of its components instead of a boolean union."""
 
         # First we generate the bridge configs from config.py
         configs = generate_bridge_configs(count=num_bridges, bridge_type=bridge_type, seed=seed)
@@ -51,42 +142,12 @@ class BridgePipeline:
         with open(self.output_dir / "bridge_summary.json", "w") as f:
             json.dump(config_json, f, indent=2)
 
-        for config in configs:
-            # Then we build the bridge model from geometry.bridge_model.py
-            bridge_model = BridgeModel(config)
-
-            bridge = bridge_model.build_bridge(with_components=False) # this is building the bridge model from geometry.bridge_model.py
-            stl_file = self.bridge_objects_dir / f"{config.bridge_id}.stl"
-            cq.exporters.export(bridge, str(stl_file))
-            mesh = o3d.io.read_triangle_mesh(str(stl_file))
-            obj_file = self.bridge_objects_dir / f"{config.bridge_id}.obj"
-            if len(mesh.vertices) > 0:
-                o3d.io.write_triangle_mesh(str(obj_file), mesh)
-                # Clean up STL file
-                stl_file.unlink()
-                logger.info(f"Successfully saved bridge {config.bridge_id} to {obj_file}")
-            
-            if include_components:
-                components, bridge = bridge_model.build_bridge(with_components=True)
-                os.makedirs(self.bridge_objects_dir / f"{config.bridge_id}", exist_ok=True) #making a directory for the bridge id
-                stl_file = self.bridge_objects_dir / f"{config.bridge_id}.stl"
-
-                for name, component in components.items():
-                    stl_file = self.bridge_objects_dir / f"{config.bridge_id}" / f"{name}.stl"
-                    cq.exporters.export(component, str(stl_file))
-
-                    mesh = o3d.io.read_triangle_mesh(str(stl_file))
-                    obj_file = self.bridge_objects_dir / f"{config.bridge_id}" / f"{name}.obj"
-                    if len(mesh.vertices) > 0:
-                        o3d.io.write_triangle_mesh(str(obj_file), mesh)
-                        # Clean up STL file
-                        stl_file.unlink()
-                        logger.info(f"Successfully saved bridge {config.bridge_id} to {obj_file}")
-                    else:
-                        logger.error(f"Failed to generate valid mesh for bridge {config.bridge_id}")
-                        return
-            
-                
+        # Every bridge is independent, so building and exporting runs in a process pool
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count(), initializer=_init_worker) as executor:
+            results = list(executor.map(_build_and_export, configs, repeat(self.bridge_objects_dir), repeat(include_components), repeat(assembly)))
+
+        if not all(results):
+            return
 
         return configs, config_json
 
@@ -1,8 +1,9 @@
-import random
 from typing import List
 from .model_config import BridgeConfig
-from dataclasses import asdict
-import pandas as pd
+from dataclasses import fields
+from functools import lru_cache
+from operator import attrgetter
+import numpy as np
 
 
 
@@ -20,16 +21,21 @@ BRIDGE_SPECS = {
 }
 
 
-def pick_span(bridge_type: str, rng: random.Random, step: int = 5, overhang_m: float = 1.0) -> tuple[float, int, float]:
-    spec = BRIDGE_SPECS[bridge_type]
-    raw_span = rng.uniform(*spec["span"])
-    depth_of_girder = raw_span * rng.uniform(*spec["depth_ratio"])
-    num_spans = rng.randint(2, 5)
+def pick_spans(bridge_types: List[str], rng: np.random.Generator, step: int = 5, overhang_m: float = 1.0) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """ Spans, number of spans, total lengths and girder depths of all bridges, drawn as arrays in one go """
+    # the span and depth ratio bounds are looked up once per bridge type, then gathered per bridge
+    type_ranges = {bridge_type: (*BRIDGE_SPECS[bridge_type]["span"], *BRIDGE_SPECS[bridge_type]["depth_ratio"]) for bridge_type in set(bridge_types)}
+    span_low, span_high, ratio_low, ratio_high = np.array([type_ranges[bridge_type] for bridge_type in bridge_types], dtype=float).reshape(-1, 4).T
+    count = len(bridge_types)
+    raw_span = rng.uniform(span_low, span_high)
+    depth_of_girder = raw_span * rng.uniform(ratio_low, ratio_high)
+    num_spans = rng.integers(2, 6, count)  # 2 to 5 spans
     total_length = raw_span * num_spans + 2 * overhang_m
     total_length = total_length - total_length % step + step
 
-    return round(raw_span, 1), num_spans, round(total_length, 1), round(depth_of_girder, 1)
+    return np.round(raw_span, 1), num_spans, np.round(total_length, 1), np.round(depth_of_girder, 1)
 
+@lru_cache(maxsize=16)
 def pick_deck_width(lanes: int, include_sidewalks: bool) -> float:
     lane_width = 3.5  # m
     hard_shoulder = 3.0    # m each side
@@ -38,17 +44,27 @@ def pick_deck_width(lanes: int, include_sidewalks: bool) -> float:
     paved_width = lanes * lane_width + 2 * (hard_shoulder + hard_strip)
     return round(paved_width + 2 * sidewalk, 2)
 
-def piers_combination(lanes: int, rng: random.Random, bridge_type: str, width_m: float, depth_of_girder: float, num_spans: int) -> int:
+PIER_CROSS_SECTIONS = ("circular", "rectangular")
+
+# BridgeConfig has __slots__ and only primitive fields, so records are read with one attrgetter
+# instead of asdict's recursive deep copy (there is no __dict__ to copy)
+CONFIG_FIELDS = tuple(field.name for field in fields(BridgeConfig))
+_config_values = attrgetter(*CONFIG_FIELDS)
+
+
+@lru_cache(maxsize=1024)
+def piers_combination(lanes: int, pier_cross_section: str, bridge_type: str, width_m: float, depth_of_girder: float, num_spans: int) -> int:
+    """ Pier layout of one bridge; the only random choice, the cross section, is drawn by the caller,
+    so the result only depends on the arguments and is memoised """
     #num_of_piers_per_lane = rng.randint(1,2) # this is the number of piers per lane
     num_of_piers_per_lane = 1 # right now we just keep equal to 1 per lane
     radius_of_pier = 0.6 # this is the radius of the pier in meters from oregon state standards
     if bridge_type == "box_girder":
-        type_of_pier = rng.choice(["hammer_head"])
+        type_of_pier = "hammer_head"
     else:
-        type_of_pier = rng.choice(["multicolumn"])
+        type_of_pier = "multicolumn"
     
-    pier_cap_type = rng.choice(["prismatic"])
-    pier_cross_section = rng.choice(["circular", "rectangular"])
+    pier_cap_type = "prismatic"
 
     num_of_piers_along_length = num_spans - 1
 
@@ -66,18 +82,23 @@ def piers_combination(lanes: int, rng: random.Random, bridge_type: str, width_m:
 
 
 def generate_bridge_configs(count: int, bridge_type: str, seed: int | None = None) -> List[BridgeConfig]:
-    rng = random.Random(seed)
+    rng = np.random.default_rng(seed)
     configs: List[BridgeConfig] = []
     step = 5 # this is the step size for span increment. 
     overhang_m = 1.0 # this is the overhang length for the bridge in meters.
     include_sidewalks = True # this is the flag to include sidewalks in the bridge.
 
-    for idx in range(1, count + 1):
-        bridge_type_picked = bridge_type or rng.choice(list(BRIDGE_SPECS.keys()))
-        lanes = rng.randint(2, 5)
-        span, num_spans, total_length, depth_of_girder = pick_span(bridge_type_picked, rng, step, overhang_m)
+    # every random parameter is drawn for all bridges at once, the loop only assembles the configs
+    bridge_type_names = list(BRIDGE_SPECS.keys())
+    bridge_types = [bridge_type] * count if bridge_type else [bridge_type_names[i] for i in rng.integers(0, len(bridge_type_names), count)]
+    all_lanes = rng.integers(2, 6, count).tolist()  # 2 to 5 lanes
+    spans, all_num_spans, total_lengths, depths_of_girder = (values.tolist() for values in pick_spans(bridge_types, rng, step, overhang_m))
+    pier_cross_sections = [PIER_CROSS_SECTIONS[i] for i in rng.integers(0, len(PIER_CROSS_SECTIONS), count)]
+
+    for idx, (bridge_type_picked, lanes, span, num_spans, total_length, depth_of_girder, pier_cross_section) in enumerate(
+            zip(bridge_types, all_lanes, spans, all_num_spans, total_lengths, depths_of_girder, pier_cross_sections), 1):
         width = pick_deck_width(lanes, include_sidewalks)
-        number_of_piers_along_length, number_of_piers_across_width, radius_of_pier, type_of_pier, pier_cap_type, pier_cross_section = piers_combination(lanes, rng, bridge_type_picked, width, depth_of_girder, num_spans)
+        number_of_piers_along_length, number_of_piers_across_width, radius_of_pier, type_of_pier, pier_cap_type, pier_cross_section = piers_combination(lanes, pier_cross_section, bridge_type_picked, width, depth_of_girder, num_spans)
         total_piers = number_of_piers_along_length * number_of_piers_across_width
         configs.append(BridgeConfig(
             bridge_id=f"bridge_{idx}", 
@@ -101,9 +122,17 @@ def generate_bridge_configs(count: int, bridge_type: str, seed: int | None = Non
     return configs
 
 def save_bridge_configs(configs: List[BridgeConfig], file_path: str) -> None:
-    df = pd.DataFrame(asdict(config) for config in configs)
-    df.to_excel(file_path, index=False) 
+    """ Write the configs to an .xlsx sheet, one row per bridge.
+    A write-only workbook streams the rows instead of building a DataFrame and a styled cell per value """
+    from openpyxl import Workbook  # only needed for the spreadsheet export
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(CONFIG_FIELDS)
+    for config in configs:
+        sheet.append(_config_values(config))
+    workbook.save(file_path)
 
 def configs_to_records(configs):
-    return [asdict(cfg) for cfg in configs]
+    return [dict(zip(CONFIG_FIELDS, _config_values(cfg))) for cfg in configs]
 
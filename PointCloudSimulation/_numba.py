@@ -0,0 +1,23 @@
+"""
+Optional numba support for the point cloud kernels.
+
+Without numba, njit is a no-op decorator and prange is range, so the jitted helpers run as
+plain Python; modules with a hot kernel check HAVE_NUMBA and use a NumPy version instead.
+"""
+
+try:
+    from numba import njit, prange, get_num_threads
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+    def get_num_threads():
+        return 1
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+__all__ = ['HAVE_NUMBA', 'njit', 'prange', 'get_num_threads']
@@ -1,63 +1,177 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+import pandas as pd
 from pathlib import Path
-import time
+from ._numba import HAVE_NUMBA, njit, prange, get_num_threads
 
+_RNG = np.random.default_rng()
 
 
 
-def farthest_point_sample(point, npoint):
+
+# compiled lazily on the first call, so importing the module stays cheap; not cached, numba cannot
+# cache it because of the get_num_threads global
+@njit(parallel=True, fastmath=True, boundscheck=False)
+def _farthest_point_indices(xyz, npoint, farthest):
+    """ xyz: contiguous float32 Nx3, return npoint sampled indices """
+    N = xyz.shape[0]
+    centroids = np.empty(npoint, np.int64)
+    distance = np.full(N, 1e10, np.float32)
+    nthreads = get_num_threads()
+    chunk = (N + nthreads - 1) // nthreads
+    best_val = np.empty(nthreads, np.float32)
+    best_idx = np.empty(nthreads, np.int64)
+    for i in range(npoint):
+        centroids[i] = farthest
+        cx = xyz[farthest, 0]
+        cy = xyz[farthest, 1]
+        cz = xyz[farthest, 2]
+        # each thread updates its own slice of distance and tracks that slice's farthest point in the same pass
+        for t in prange(nthreads):
+            local_val = np.float32(-1.0)
+            local_idx = 0
+            for j in range(t * chunk, min((t + 1) * chunk, N)):
+                dx = xyz[j, 0] - cx
+                dy = xyz[j, 1] - cy
+                dz = xyz[j, 2] - cz
+                d = dx * dx + dy * dy + dz * dz
+                if d < distance[j]:
+                    distance[j] = d
+                if distance[j] > local_val:
+                    local_val = distance[j]
+                    local_idx = j
+            best_val[t] = local_val
+            best_idx[t] = local_idx
+        # only the nthreads partial maxima are reduced serially; strict > keeps the first index like argmax
+        farthest = best_idx[0]
+        for t in range(1, nthreads):
+            if best_val[t] > best_val[0]:
+                best_val[0] = best_val[t]
+                farthest = best_idx[t]
+    return centroids
+
+
+def _farthest_point_indices_numpy(xyz, npoint, farthest):
+    """ NumPy version of _farthest_point_indices for when numba is missing: one vectorised pass per pick
+    into preallocated buffers, instead of the kernel's scalar loop running as plain Python """
+    N = xyz.shape[0]
+    centroids = np.empty(npoint, np.int64)
+    distance = np.full(N, 1e10, np.float32)
+    diff = np.empty_like(xyz)
+    dist = np.empty(N, np.float32)
+    for i in range(npoint):
+        centroids[i] = farthest
+        np.subtract(xyz, xyz[farthest], out=diff)
+        np.einsum('ij,ij->i', diff, diff, out=dist)
+        np.minimum(distance, dist, out=distance)
+        farthest = int(distance.argmax())
+    return centroids
+
+
+def farthest_point_sample(point, npoint, seed=None):
     """
     Input:
         xyz: pointcloud data, [N, D]
         npoint: number of samples
+        seed: seed of the random start point, None for the module generator
     Return:
         centroids: sampled pointcloud index, [npoint, D]
     """
     N, D = point.shape
-    xyz = point[:,:3]
-    centroids = np.zeros((npoint,))
-    distance = np.ones((N,)) * 1e10
-    farthest = np.random.randint(0, N)
-    for i in range(npoint):
-        centroids[i] = farthest
-        centroid = xyz[farthest, :]
-        dist = np.sum((xyz - centroid) ** 2, -1)
-        mask = dist < distance
-        distance[mask] = dist[mask]
-        farthest = np.argmax(distance, -1)
-    point = point[centroids.astype(np.int32)]
+    xyz = np.ascontiguousarray(point[:, :3], dtype=np.float32)
+    rng = _RNG if seed is None else np.random.default_rng(seed)
+    farthest = rng.integers(0, N)
+    fps = _farthest_point_indices if HAVE_NUMBA else _farthest_point_indices_numpy
+    centroids = fps(xyz, int(npoint), int(farthest))
+    point = point[centroids]
     return point
 
 def pc_norm(pc):
-    """ pc: NxC, return NxC """
-    xyz = pc[:, :3]
-    other_feature = pc[:, 3:]
+    """ pc: NxC, return NxC normalised in place (float32) """
+    pc = np.ascontiguousarray(pc, dtype=np.float32)
+    xyz = pc[:, :3]  # view, so the updates below land in pc without a concatenate
 
-    centroid = np.mean(xyz, axis=0)
-    xyz = xyz - centroid
-    m = np.max(np.sqrt(np.sum(xyz ** 2, axis=1)))
-    xyz = xyz / m
+    # every intermediate stays float32, matching the saved output
+    xyz -= xyz.mean(axis=0, dtype=np.float32)
+    # the largest squared norm in one einsum pass, a single square root instead of one per point
+    m = np.sqrt(np.einsum('ij,ij->i', xyz, xyz).max())
+    xyz *= np.float32(1.0) / m
 
-    pc = np.concatenate((xyz, other_feature), axis=1)
     return pc
 
 
-def convert_bridge_data(input_file, output_dir):
-    """Convert bridge point cloud data from HELIOS output to .npy format"""
-    
+def load_points(input_file, ncols=11):
+    """ Read a .bin point file, a raw float32 dump with ncols columns; .xyz text is streamed by sample_points """
+    return np.fromfile(input_file, dtype=np.float32).reshape(-1, ncols)
 
-    
-  
+
+def sample_points(input_file, k=8192, chunksize=1_000_000, rng=None):
+    """ Stream a point file in chunks and keep a uniform sample of k rows, drawn with rng (default: module generator).
+    Returns (rows, number of rows read); all rows are returned when the file has fewer than k.
+    Raises ValueError when the file contains no points """
+    rng = _RNG if rng is None else rng
+    if Path(input_file).suffix == '.bin':
+        data = load_points(input_file)
+        num_points = len(data)
+        if not num_points:
+            raise ValueError(f"{input_file} contains no points")
+        # raw dumps are read whole, so they are sampled without replacement afterwards
+        if num_points > k:
+            data = data[rng.choice(num_points, k, replace=False, shuffle=False)]  # avoids a full length-N permutation
+        return data, num_points
+
+    if Path(input_file).stat().st_size == 0:  # an empty file cannot be memory mapped
+        raise ValueError(f"{input_file} contains no points")
+    reservoir = None
+    seen = 0
+    try:
+        chunks = pd.read_csv(input_file, sep=r'\s+', header=None, dtype=np.float32, engine='c', na_filter=False, memory_map=True, chunksize=chunksize)
+    except pd.errors.EmptyDataError:
+        raise ValueError(f"{input_file} contains no points") from None
+    for chunk in chunks:
+        rows = chunk.to_numpy()
+        if reservoir is None:
+            reservoir = np.empty((k, rows.shape[1]), dtype=np.float32)
+
+        # the first k rows fill the reservoir
+        fill = max(0, min(k - seen, len(rows)))
+        reservoir[seen:seen + fill] = rows[:fill]
+
+        # every later row i (0-based) replaces a random slot with probability k / (i + 1)
+        rest = rows[fill:]
+        if len(rest):
+            row_index = seen + fill + np.arange(len(rest))
+            keep = rng.random(len(rest)) < k / (row_index + 1)
+            reservoir[rng.integers(0, k, keep.sum())] = rest[keep]
+        seen += len(rows)
+
+    if reservoir is None:
+        raise ValueError(f"{input_file} contains no points")
+    return reservoir[:min(seen, k)], seen
+
+
+def convert_bridge_data(input_file, output_dir, seed=None):
+    """Convert bridge point cloud data from HELIOS output to .npy format.
+    seed makes the point sampling reproducible, None uses the module generator"""
+    input_file = Path(input_file)
+    output_dir = Path(output_dir)
+    output_file = output_dir / f"{input_file.stem}.npy"
         
-    if not os.path.exists(input_file):
+    if not input_file.is_file():
         print(f"Warning: {input_file} not found, skipping...")
         return
         
     print(f"\nConverting {input_file}...")
     print(f"  Source: {input_file}")
-    data = np.loadtxt(input_file, delimiter=' ')
-    print(f"Shape: {data.shape}, Sample: {data[0][:5]}...")
+    rng = _RNG if seed is None else np.random.default_rng(seed)
+    # larger files are sampled down to 8192 rows while parsing, so no downsampling is left to do below
+    try:
+        data, num_points = sample_points(input_file, rng=rng)
+    except ValueError as e:
+        print(f"Warning: {e}, skipping...")
+        return
+    print(f"Read {num_points} points, Shape: {data.shape}, Sample: {data[0][:5]}...")
     
     # Handle different formats
     if data.shape[1] == 11:
@@ -75,32 +189,34 @@ def convert_bridge_data(input_file, output_dir):
         return
     
     # Ensure we have the right number of points (8192 is standard for PointLLM)
-    if len(point_cloud) > 8192:
-        # Randomly sample 8192 points
-        start_time = time.time()
-        print("Randomly sampling 8192 points from ", len(point_cloud))
-        indices = np.random.choice(len(point_cloud), 8192, replace=False)
-        point_cloud = point_cloud[indices]
-        end_time = time.time()
-        print(f"Random sampling time: {end_time - start_time} seconds")
-    elif len(point_cloud) < 8192:
+    if len(point_cloud) < 8192:
         print("Upsampling to 8192 points from ", len(point_cloud))
         # Upsample by repeating points
-        indices = np.random.choice(len(point_cloud), 8192, replace=True)
+        indices = rng.integers(0, len(point_cloud), 8192)
         point_cloud = point_cloud[indices]
     
-    # Normalize point cloud coordinates
-    
+    # Normalize point cloud coordinates, pc_norm returns a contiguous float32 array
     point_cloud = pc_norm(point_cloud)
     
     # Save as .npy file
-    output_file = os.path.join(output_dir, f"{input_file.stem}.npy")
-    np.save(output_file, point_cloud.astype(np.float32))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    np.save(output_file, point_cloud, allow_pickle=False)
     
     print(f"Saved {input_file.stem} with shape {point_cloud.shape}")
         
     print(f"Conversion complete. Files saved to {output_dir}")
 
+def convert_bridge_files(files, output_dir, max_workers=None, seed=None):
+    """Convert several point cloud files in parallel, one worker process per file.
+    Forked workers would all inherit the same _RNG state, so every file gets its own spawned seed."""
+    files = list(files)
+    seeds = np.random.SeedSequence(seed).spawn(len(files))
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = [executor.submit(convert_bridge_data, file, output_dir, seed=file_seed) for file, file_seed in zip(files, seeds)]
+        for future in futures:
+            future.result()  # re-raise a worker's exception here
+
+
 if __name__ == "__main__":
     input_file = "H:/Datasets/syntehtic_data/cad_query/helios/bridge_5/TLS_5_complete.xyz"
     output_dir = "H:/Datasets/syntehtic_data/cad_query/helios/bridge_5/npy"
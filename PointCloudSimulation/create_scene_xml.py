@@ -1,5 +1,24 @@
 import os
 from pathlib import Path
+from xml.sax.saxutils import escape
+
+
+# Scene skeleton and one objloader part per component OBJ, filled with format_map like the survey template
+_SCENE_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<document>
+    <scene id="TLS_{bridge_id}" name="TLS_{bridge_id}">
+
+{parts}		
+    </scene>
+</document>"""
+
+_PART_TEMPLATE = """        <part id="{idx}">
+            <filter type="objloader">
+                <param type="string" key="filepath" value="{obj_path}" />
+                <param type="string" key="up" value="z" />
+            </filter>
+        </part>
+"""
 
 
 def create_scene_xml(bridge, output_path):
@@ -20,27 +39,11 @@ def create_scene_xml(bridge, output_path):
     if bridge_folder.exists():
         obj_files = sorted([f.name for f in bridge_folder.glob("*.obj")])
     
-    # Start building XML content
-    xml_parts = ['<?xml version="1.0" encoding="UTF-8"?>']
-    xml_parts.append('<document>')
-    xml_parts.append(f'    <scene id="TLS_{bridge_id}" name="TLS_{bridge_id}">')
-    xml_parts.append('')
-    
     # Add each component as a separate part (use absolute path so helios finds files on Linux)
-    for idx, obj_file in enumerate(obj_files):
-        obj_path = (bridge_folder / obj_file).resolve()
-        xml_parts.append(f'        <part id="{idx}">')
-        xml_parts.append('            <filter type="objloader">')
-        xml_parts.append(f'                <param type="string" key="filepath" value="{obj_path}" />')
-        xml_parts.append('                <param type="string" key="up" value="z" />')
-        xml_parts.append('            </filter>')
-        xml_parts.append('        </part>')
-    
-    xml_parts.append('		')
-    xml_parts.append('    </scene>')
-    xml_parts.append('</document>')
-    
-    xml_content = '\n'.join(xml_parts)
+    # the id and the paths are placed inside attribute values, escaped like in the survey XML
+    parts = ''.join(_PART_TEMPLATE.format(idx=idx, obj_path=escape(str((bridge_folder / obj_file).resolve()), {'"': '&quot;'}))
+                    for idx, obj_file in enumerate(obj_files))
+    xml_content = _SCENE_TEMPLATE.format(bridge_id=escape(str(bridge_id), {'"': '&quot;'}), parts=parts)
     
     with open(output_path, 'w') as f:
         f.write(xml_content)
@@ -1,17 +1,169 @@
 import json
+import hashlib
 import argparse
 from pathlib import Path
 import os
-from collections import defaultdict
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-from .scanner_positions import calculate_scanner_positions
-from .create_survey_xml import create_survey_xml
-from .create_scene_xml import create_scene_xml
-from .semantic_segmentation import semantic_segmentation
-from .convert_to_npy import convert_bridge_data
+try:
+    import orjson
+except ImportError:  # orjson is optional, the stdlib json is used then
+    orjson = None
 
+from .scanner_positions import calculate_scanner_positions, calculate_scanner_positions_batch, positions_to_dict
+from .create_survey_xml import create_survey_xml, _SURVEY_TEMPLATE
+from .create_scene_xml import create_scene_xml, _SCENE_TEMPLATE, _PART_TEMPLATE
+from .semantic_segmentation import merge_and_segment, COMPONENT_NAMES
+from .convert_to_npy import convert_bridge_files
 
-def pointcloud_complete_pipeline(run_simulation=False, num_bridges=None, run_segmentation=False, convert_to_npy=False):
+
+# HELIOS is multithreaded itself, so only a few bridges are simulated at once and the cores are split between them
+DEFAULT_MAX_WORKERS = 2
+
+
+def _xml_key(bridge, positions):
+    """ Hash of everything the survey and scene XMLs of a bridge are generated from """
+    # the scene lists the component OBJ files of the bridge by absolute path, so a moved checkout gets new XMLs
+    bridge_folder = Path(__file__).parent.parent / "Dataset" / "BridgeModels" / bridge['bridge_id']
+    obj_files = sorted(str(f.resolve()) for f in bridge_folder.glob("*.obj"))
+    # the templates themselves are hashed, so editing either one regenerates the XMLs
+    params = {"bridge": bridge, "positions": positions, "obj_files": obj_files,
+              "templates": [_SURVEY_TEMPLATE, _SCENE_TEMPLATE, _PART_TEMPLATE]}
+    return hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def run_helios_simulation(survey_path, output_dir, helios_exe="helios", num_threads=None):
+    """ Run HELIOS on a survey without a shell; its output streams to this process' stdout.
+    num_threads is passed as -j, None lets HELIOS use every core.
+    Returns the HELIOS return code """
+    cmd = [helios_exe, str(survey_path), "--output", str(output_dir), "-vt"] #-vt means verbose output only time and errors will be reported
+    if num_threads is not None:
+        cmd += ["-j", str(num_threads)]
+    print(f"Running simulation: {' '.join(cmd)}")
+    result = subprocess.run(cmd, check=False)
+    if result.returncode != 0:
+        print(f"Warning: HELIOS exited with code {result.returncode} for {survey_path}")
+    return result.returncode
+
+
+def process_bridge(bridge, positions=None, *, surveys_dir, scenes_dir, scan_output_dir, run_simulation=False,
+                   run_segmentation=False, convert_to_npy=False, segmentation_format='xyz', helios_threads=None):
+    """ Create the survey and scene XMLs of one bridge and optionally simulate, merge and segment its scans.
+    Bridges are independent, so this runs in a worker process. positions are the precomputed scanner
+    positions of the bridge, they are calculated here when not given. helios_threads is the thread count
+    of each HELIOS run.
+    Returns (scanner info entry, merged scan to convert or None) """
+    scan_legs_output_dir = scan_output_dir / "scan_legs"
+    segmented_output_dir = scan_output_dir / "segmented"
+    merged_output_dir = scan_output_dir / "merged"
+
+    bridge_id = bridge['bridge_id']
+    print(f"Processing {bridge_id}...")
+
+    # Calculate scanner positions
+    if positions is None:
+        positions = calculate_scanner_positions(bridge)
+    print(f"  Scanner positions calculated:")
+    for leg_name, pos in positions.items():
+        print(f"    {leg_name}: x={pos['x']:.1f}, y={pos['y']:.1f}, z={pos['z']:.1f}")
+
+    survey_path = surveys_dir / f"TLS_{bridge_id}_survey.xml"
+    scene_path = scenes_dir / f"TLS_{bridge_id}_scene.xml"
+    # the XMLs are only rewritten when their inputs changed since the last run
+    key_file = survey_path.with_suffix(".sha1")
+    key = _xml_key(bridge, positions)
+    if survey_path.exists() and scene_path.exists() and key_file.exists() and key_file.read_text() == key:
+        print(f"  Survey and scene files are up to date, skipping")
+    else:
+        # Create survey XML
+        create_survey_xml(bridge, positions, survey_path)
+
+        # Create scene XML
+        create_scene_xml(bridge, scene_path)
+        key_file.write_text(key)
+
+    # Store bridge info for export
+    scanner_info = {
+        'bridge_id': bridge_id,
+        'dimensions': {
+            'width_m': bridge['width_m'],
+            'length_m': bridge['total_length_m']
+        },
+        'scanner_positions': {
+            leg_name: {
+                'x': round(pos['x'], 2),
+                'y': round(pos['y'], 2),
+                'z': round(pos['z'], 2)
+            }
+            for leg_name, pos in positions.items()
+        }
+    }
+
+    merged_output_file = None
+
+    # Run simulation if requested
+    if run_simulation:
+        scan_legs_output_dir.mkdir(parents=True, exist_ok=True)
+        print(f"Running simulation...")
+        run_helios_simulation(survey_path, scan_legs_output_dir, num_threads=helios_threads)
+        print(f"Saving raw point clouds with timestamped folders in {scan_legs_output_dir} with each legs.")
+
+        # Merging the leg scans into a single file
+        print(f"Merging the leg scans into a single file...")
+
+
+        # now we go to each tls bridge folder and pick the last simulation run.
+
+        # this is the directory where the leg scans are saved
+        scan_legs_bridge_dir = scan_legs_output_dir / f"TLS_{bridge_id}"
+        if scan_legs_bridge_dir.exists():
+            # Find the latest timestamped folder; scandir entries carry their type, so only folders are stat'ed
+            with os.scandir(scan_legs_bridge_dir) as entries:
+                latest_scan_dir = max((entry for entry in entries if entry.is_dir()), key=lambda entry: entry.stat().st_mtime).path
+            print(f"Processing legs scan from: {latest_scan_dir}")
+
+            #reading all leg xyz files from the latest scan directory.
+            with os.scandir(latest_scan_dir) as entries:
+                xyz_files = [entry.path for entry in entries if entry.name.endswith(".xyz")]
+
+            # Write merged .xyz file containing all scans
+            merged_bridge_dir = merged_output_dir / f"TLS_{bridge_id}"
+            os.makedirs(merged_bridge_dir, exist_ok=True)
+            merged_output_file = merged_bridge_dir / f"{bridge_id}_complete.xyz"
+
+            # Creating the segmented output directory for the bridge if segmentation is requested
+            segmented_bridge_dir = None
+            if run_segmentation:
+                print(f"  Running semantic segmentation...")            
+                segmented_bridge_dir = segmented_output_dir / f"TLS_{bridge_id}"
+                os.makedirs(segmented_bridge_dir, exist_ok=True)
+
+            # merging and segmentation stream every line straight to its output files
+            num_points, component_counts = merge_and_segment(xyz_files, merged_output_file, segmented_bridge_dir, segmentation_format)
+            print(f"  ✓ Merged all scans into {bridge_id}_complete.xyz ({num_points:,} points)")
+
+            if run_segmentation:
+                for component_id, count in sorted(component_counts.items()):
+                    print(f"    - {COMPONENT_NAMES[component_id]}.{segmentation_format}: {count:,} points")
+                print(f"Split {sum(component_counts.values()):,} points into {len(component_counts)} components")
+                print(f"  ✓ Semantic segmentation completed")
+            else:
+                print(f"No semantic segmentation requested")
+
+        else:
+
+            print(f"Warning: Output directory not found: {scan_legs_bridge_dir}")
+
+
+    print(f"Completed {bridge_id}\n")
+    # the merged scan is only converted when requested
+    return scanner_info, merged_output_file if convert_to_npy else None
+
+
+def pointcloud_complete_pipeline(run_simulation=False, num_bridges=None, run_segmentation=False, convert_to_npy=False,
+                                 segmentation_format='xyz', max_workers=DEFAULT_MAX_WORKERS):
     """Main pipeline to generate point cloud complete dataset.
     This pipeline will generate the point cloud complete dataset including the raw point clouds, segmented point clouds, and merged point clouds.
     It will also convert the point clouds to NPY format if requested.
@@ -20,6 +172,10 @@ def pointcloud_complete_pipeline(run_simulation=False, num_bridges=None, run_seg
         num_bridges: Number of bridges to process (None = all bridges).
         run_segmentation: If True, run semantic segmentation after simulations
         convert_to_npy: If True, convert the point clouds to NPY format
+        segmentation_format: 'xyz' for text component files, 'npz' for compressed binary ones
+        max_workers: Number of bridges processed in parallel (None = one per CPU). Each HELIOS run gets
+            cpu_count // max_workers threads, so more workers means fewer threads per simulation, not more
+            total load; more than a few only pays off when the runs are short and I/O bound
     """
     # Paths
     base_dir = Path(__file__).parent.parent
@@ -32,9 +188,6 @@ def pointcloud_complete_pipeline(run_simulation=False, num_bridges=None, run_seg
     
     # Dataset output paths
     scan_output_dir = dataset_dir / "PointCloudScans"
-    scan_legs_output_dir = scan_output_dir / "scan_legs"
-    segmented_output_dir = scan_output_dir / "segmented"
-    merged_output_dir = scan_output_dir / "merged"
     
     
     # Create directories if they don't exist
@@ -42,158 +195,56 @@ def pointcloud_complete_pipeline(run_simulation=False, num_bridges=None, run_seg
     scenes_dir.mkdir(parents=True, exist_ok=True)
     
     # Read bridge summary
-    with open(bridge_summary_path, 'r') as f:
-        bridges = json.load(f)
+    with open(bridge_summary_path, 'rb') as f:
+        bridges = orjson.loads(f.read()) if orjson else json.load(f)
+    total_bridges = len(bridges)
     
     # Limit number of bridges if specified
     if num_bridges is not None:
         bridges = bridges[:num_bridges]
-        print(f"Processing {len(bridges)} of {len(json.load(open(bridge_summary_path)))} bridges\n")
+        print(f"Processing {len(bridges)} of {total_bridges} bridges\n")
     else:
         print(f"Found {len(bridges)} bridges to process\n")
     
-    # Store scanner info for export
-    scanner_info = []
-    
-    # Process each bridge
-    for bridge in bridges:
-        bridge_id = bridge['bridge_id']
-        print(f"Processing {bridge_id}...")
-        
-        # Calculate scanner positions
-        positions = calculate_scanner_positions(bridge)
-        print(f"  Scanner positions calculated:")
-        for leg_name, pos in positions.items():
-            print(f"    {leg_name}: x={pos['x']:.1f}, y={pos['y']:.1f}, z={pos['z']:.1f}")
-        
-        # Create survey XML
-        survey_path = surveys_dir / f"TLS_{bridge_id}_survey.xml"
-        create_survey_xml(bridge, positions, survey_path)
-        
-        # Create scene XML
-        scene_path = scenes_dir / f"TLS_{bridge_id}_scene.xml"
-        create_scene_xml(bridge, scene_path)
-        
-        # Store bridge info for export
-        scanner_info.append({
-            'bridge_id': bridge_id,
-            'dimensions': {
-                'width_m': bridge['width_m'],
-                'length_m': bridge['total_length_m']
-            },
-            'scanner_positions': {
-                leg_name: {
-                    'x': round(pos['x'], 2),
-                    'y': round(pos['y'], 2),
-                    'z': round(pos['z'], 2)
-                }
-                for leg_name, pos in positions.items()
-            }
-        })
-        
-        
-        
-        
-        # Run simulation if requested
-        if run_simulation:
-            scan_legs_output_dir.mkdir(parents=True, exist_ok=True)
-            print(f"Running simulation...")
-            cmd = f"helios {survey_path} --output {scan_legs_output_dir} -vt" #-vt means verbose output only time and errors will be reported
-            print(f"Running simulation: {cmd}")
-            os.system(cmd)
-            print(f"Saving raw point clouds with timestamped folders in {scan_legs_output_dir} with each legs.")
-            
-            # Merging the leg scans into a single file
-            print(f"Merging the leg scans into a single file...")
-
-
-            # now we go to each tls bridge folder and pick the last simulation run.
-
-            # this is the directory where the leg scans are saved
-            scan_legs_bridge_dir = scan_legs_output_dir / f"TLS_{bridge_id}"
-            if scan_legs_bridge_dir.exists():
-                # Get all timestamped folders and sort to find the latest
-                timestamp_folders = sorted([d for d in scan_legs_bridge_dir.iterdir() if d.is_dir()], 
-                                         key=lambda x: x.stat().st_mtime, reverse=True)
-                
-                latest_scan_dir = timestamp_folders[0]
-                print(f"Processing legs scan from: {scan_legs_bridge_dir / latest_scan_dir.name}")
-                    
-                #reading all leg xyz files from the latest scan directory.
-                xyz_files = [
-                        os.path.join(latest_scan_dir, fname)
-                        for fname in os.listdir(latest_scan_dir)
-                        if fname.endswith(".xyz")
-                    ]
-                
-                all_lines = []
-                component_files = defaultdict(list)
-                
-                for leg_file in xyz_files:
-                    with open(leg_file, 'r') as f:
-                        for line_num, line in enumerate(f, 1):
-                            line = line.strip()
-                            if not line:  # Skip empty lines
-                                continue
-
-                            # Collect line for the merged output
-                            all_lines.append(line)
-
-                            # Split the line by whitespace
-                            parts = line.split()
-                            
-                            # Get the 9th column (index 8)
-                            component_id = int(parts[8])
-                            component_files[component_id].append(line)
-                
-                # Write merged .xyz file containing all scans
-                merged_bridge_dir = merged_output_dir / f"TLS_{bridge_id}"
-                os.makedirs(merged_bridge_dir, exist_ok=True)
-                merged_output_file = merged_bridge_dir / f"{bridge_id}_complete.xyz"
-                with open(merged_output_file, 'w') as f_merged:
-                    f_merged.write('\n'.join(all_lines) + '\n')
-                    print(f"  ✓ Merged all scans into {bridge_id}_complete.xyz ({len(all_lines):,} points)")
-        
-        
-
-                # Run semantic segmentation if requested
-                if run_segmentation:
-
-                    print(f"  Running semantic segmentation...")            
-                    # Creating the segmented output directory for the bridge
-                    segmented_output_dir.mkdir(parents=True, exist_ok=True)
-                    segmented_bridge_dir = segmented_output_dir / f"TLS_{bridge_id}"
-                    os.makedirs(segmented_bridge_dir, exist_ok=True)
-                    # Run segmentation with Dataset output directories
-                    semantic_segmentation(component_files, segmented_bridge_dir)
-                    print(f"  ✓ Semantic segmentation completed")
-                else:
-                    print(f"No semantic segmentation requested")
-
-                # Convert to NPY format if requested
-                if convert_to_npy:
-                    print(f"\n{'='*70}")
-                    print(f"Converting point clouds to NPY format...")
-                    print(f"{'='*70}\n")
-
-                    npy_output_dir = scan_output_dir / "npy"
-                    os.makedirs(npy_output_dir, exist_ok=True)
-                    convert_bridge_data(merged_output_file, npy_output_dir)
+    # every bridge writes its own XMLs and scans, so they are processed in parallel; the cores are split
+    # between the concurrent HELIOS runs instead of every run starting one thread per core
+    workers = max_workers or os.cpu_count() or 1
+    worker = partial(process_bridge, surveys_dir=surveys_dir, scenes_dir=scenes_dir,
+                     scan_output_dir=scan_output_dir, run_simulation=run_simulation,
+                     run_segmentation=run_segmentation, convert_to_npy=convert_to_npy,
+                     segmentation_format=segmentation_format,
+                     helios_threads=max(1, (os.cpu_count() or 1) // workers))
+    # the scanner positions of all bridges are calculated at once
+    all_positions = calculate_scanner_positions_batch([bridge['width_m'] for bridge in bridges],
+                                                      [bridge['total_length_m'] for bridge in bridges])
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(worker, bridges, map(positions_to_dict, all_positions)))
 
-            else:
-    
-                print(f"Warning: Output directory not found: {scan_legs_bridge_dir}")
-                
-        
-        print(f"Completed {bridge_id}\n")
+    # Store scanner info for export, in bridge order
+    scanner_info = [info for info, _ in results]
+    # merged scans to convert once every bridge has been simulated
+    merged_files = [merged_file for _, merged_file in results if merged_file is not None]
+
+    # the conversions are independent, so all merged scans are converted in parallel
+    if merged_files:
+        print(f"\n{'='*70}")
+        print(f"Converting point clouds to NPY format...")
+        print(f"{'='*70}\n")
 
+        npy_output_dir = scan_output_dir / "npy"
+        os.makedirs(npy_output_dir, exist_ok=True)
+        # the conversion is single-threaded per file, so it uses every core regardless of max_workers
+        convert_bridge_files(merged_files, npy_output_dir)
     
     # Export scanner information to JSON
     dataset_dir = base_dir / "Dataset" / "PointCloudScans"
     dataset_dir.mkdir(parents=True, exist_ok=True)
     scanner_info_path = dataset_dir / "scanner_positions.json"
-    with open(scanner_info_path, 'w') as f:
-        json.dump(scanner_info, f, indent=2)
+    if orjson:
+        scanner_info_path.write_bytes(orjson.dumps(scanner_info, option=orjson.OPT_INDENT_2))
+    else:
+        with open(scanner_info_path, 'w') as f:
+            json.dump(scanner_info, f, indent=2)
     print(f"Scanner info exported to: {scanner_info_path}")
     
     
@@ -214,9 +265,16 @@ if __name__ == "__main__":
                         help='Run semantic segmentation after simulations')
     parser.add_argument('--convert_to_npy', action='store_true',
                         help='Convert point clouds to NPY format after simulations')
+    parser.add_argument('--max_workers', type=int, default=DEFAULT_MAX_WORKERS,
+                        help='Number of bridges processed in parallel, the cores are split between their '
+                             f'HELIOS runs (default: {DEFAULT_MAX_WORKERS})')
+    parser.add_argument('--segmentation_format', '--segmentation-format', choices=['xyz', 'npz'], default='xyz',
+                        help='Segmented component files as xyz text or compressed binary npz (default: xyz)')
     
     args = parser.parse_args()
     pointcloud_complete_pipeline(run_simulation=args.run_simulation, 
                    num_bridges=args.num_bridges,
                    run_segmentation=args.semantic_segmentation,
-                   convert_to_npy=args.convert_to_npy)
+                   convert_to_npy=args.convert_to_npy,
+                   segmentation_format=args.segmentation_format,
+                   max_workers=args.max_workers)
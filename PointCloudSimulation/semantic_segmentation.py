@@ -1,35 +1,107 @@
-import os
-import sys
+import io
+import numpy as np
+import pandas as pd
+from collections import defaultdict
 
+from ._numba import HAVE_NUMBA, njit
 
-def semantic_segmentation(component_files, segmented_bridge_dir):   
- 
 
-    component_names = {
-        0: "approach_slab",
-        1: "back_wall",
-        2: "deck",
-        3: "piers",
-        4: "railings",
-        5: "wing_walls"
-    }
+COMPONENT_NAMES = {
+    0: "approach_slab",
+    1: "back_wall",
+    2: "deck",
+    3: "piers",
+    4: "railings",
+    5: "wing_walls"
+}
 
 
+@njit(cache=True)
+def _bucket_by_id(component_ids, num_components):
+    """ Counting sort of the row indices by component id: (offsets, counts, row indices) """
+    counts = np.zeros(num_components, np.int64)
+    for i in range(component_ids.shape[0]):
+        counts[component_ids[i]] += 1
+    offsets = np.cumsum(counts) - counts
+    cursor = offsets.copy()
+    rows = np.empty(component_ids.shape[0], np.int64)
+    for i in range(component_ids.shape[0]):
+        component_id = component_ids[i]
+        rows[cursor[component_id]] = i
+        cursor[component_id] += 1
+    return offsets, counts, rows
 
-    # Writing separate files for each component
-    print(f"  Writing segmented components...")
-    for component_id, lines in sorted(component_files.items()):
-        output_file = segmented_bridge_dir / f"{component_names[component_id]}.xyz"
-        with open(output_file, 'w') as f:
-            f.write('\n'.join(lines) + '\n')
-        
-        print(f"    - {component_names[component_id]}.xyz: {len(lines):,} points")
-    print(f"Split {sum(len(lines) for lines in component_files.values()):,} points into {len(component_files)} components")
 
+def _bucket_by_id_numpy(component_ids, num_components):
+    """ NumPy version of _bucket_by_id for when numba is missing: a stable argsort keeps each
+    component's rows in file order, instead of the counting loops running as plain Python """
+    counts = np.bincount(component_ids, minlength=num_components)
+    offsets = np.cumsum(counts) - counts
+    rows = np.argsort(component_ids, kind="stable")
+    return offsets, counts, rows
 
 
-if __name__ == "__main__":
-    
+def _component_groups(component_ids):
+    """ Yield (component id, row indices) for every component present, rows in file order """
+    bucket = _bucket_by_id if HAVE_NUMBA else _bucket_by_id_numpy
+    offsets, counts, rows = bucket(component_ids, int(component_ids.max()) + 1)
+    for component_id in np.flatnonzero(counts):
+        yield int(component_id), rows[offsets[component_id]:offsets[component_id] + counts[component_id]]
 
-    input_dir = "H:/Datasets/syntehtic_data/cad_query/helios/bridge_5/"
-    semantic_segmentation(input_dir)
+
+def merge_and_segment(leg_files, merged_output_file, segmented_bridge_dir=None, fmt='xyz'):
+    """ Merge the leg scans into merged_output_file, one leg file at a time.
+    With segmented_bridge_dir, the points are also split by component (9th column): fmt='xyz' appends
+    the text lines to one .xyz file per component, fmt='npz' saves one compressed .npz per component
+    with float32 xyz and int8 ids. Only one leg file is held in memory as text.
+    Returns (number of points, points per component) """
+    if fmt not in ('xyz', 'npz'):
+        raise ValueError(f"Unsupported segmentation format: {fmt}")
+
+    buffering = 4 * 1024 * 1024
+    num_points = 0
+    component_counts = defaultdict(int)
+    handles = {}
+    component_points = defaultdict(list)  # fmt='npz': xyz blocks per component
+    try:
+        with open(merged_output_file, 'w', buffering=buffering) as merged:
+            for leg_file in leg_files:
+                with open(leg_file, 'r') as f:
+                    # the lines keep a single trailing newline, so they are written through the buffer as they are
+                    lines = np.array([line + '\n' for line in (raw.strip() for raw in f) if line], dtype=object)  # Skip empty lines
+                if not len(lines):
+                    continue
+                merged.writelines(lines)
+                num_points += len(lines)
+
+                if segmented_bridge_dir is None:
+                    continue
+                # the needed columns are parsed by the C tokenizer from the lines already read, so every
+                # parsed row is the line at the same index, then the rows are grouped at once
+                columns = [0, 1, 2, 8] if fmt == 'npz' else [8]
+                parsed = pd.read_csv(io.StringIO(''.join(lines)), sep=r'\s+', header=None, usecols=columns,
+                                     engine='c', na_filter=False).to_numpy()
+                if len(parsed) != len(lines):
+                    raise ValueError(f"{leg_file}: parsed {len(parsed):,} rows from {len(lines):,} lines")
+                component_ids = parsed[:, -1].astype(np.int64)
+                for component_id, rows in _component_groups(component_ids):
+                    component_counts[component_id] += len(rows)
+                    if fmt == 'npz':
+                        component_points[component_id].append(parsed[rows, :3].astype(np.float32))
+                        continue
+                    handle = handles.get(component_id)
+                    if handle is None:
+                        output_file = segmented_bridge_dir / f"{COMPONENT_NAMES[component_id]}.xyz"
+                        handle = handles[component_id] = open(output_file, 'w', buffering=buffering)
+                    handle.writelines(lines[rows])
+    finally:
+        for handle in handles.values():
+            handle.close()
+
+    # binary components: 13 bytes per point instead of the ~60 byte text line
+    for component_id, blocks in component_points.items():
+        xyz = np.concatenate(blocks)
+        np.savez_compressed(segmented_bridge_dir / f"{COMPONENT_NAMES[component_id]}.npz",
+                            xyz=xyz, ids=np.full(len(xyz), component_id, dtype=np.int8))
+
+    return num_points, dict(component_counts)
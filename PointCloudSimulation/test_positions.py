@@ -0,0 +1,36 @@
+"""
+Print the scanner positions of the first generated bridge.
+
+Run from the repository root as a module, so the package imports resolve:
+    python -m PointCloudSimulation.test_positions
+"""
+
+import json
+import sys
+
+if not __package__:
+    sys.exit("Run this script as a module from the repository root: python -m PointCloudSimulation.test_positions")
+
+from .scanner_positions import calculate_scanner_positions_batch
+
+LEG_LABELS = ['Left', 'Right', 'Front', 'Back', 'Below1', 'Below2', 'Top1', 'Top2']
+
+
+def load_bridges(summary_path='Generated_Bridges/bridge_summary.json'):
+    """Read the bridge records from the summary file."""
+    with open(summary_path, 'r') as f:
+        return json.load(f)
+
+
+if __name__ == "__main__":
+    # Read bridge_1 data
+    bridge = load_bridges()[0]  # bridge_1
+    width = bridge['width_m']
+    length = bridge['total_length_m']
+
+    print(f"Bridge: {bridge['bridge_id']}")
+    print(f"Dimensions: Length={length}m, Width={width}m\n")
+
+    print('Scanner Positions:')
+    for leg, (label, (x, y, z)) in enumerate(zip(LEG_LABELS, calculate_scanner_positions_batch([width], [length])[0]), 1):
+        print(f"Leg {leg} ({label}):".ljust(16) + f"x={x:7.1f}, y={y:7.1f}, z={z:7.1f}")
@@ -4,11 +4,13 @@ Visualizes .npy point cloud files using Open3D
 """
 
 import numpy as np
-import open3d as o3d
 import argparse
+import os
 from pathlib import Path
 import sys
 
+# open3d is imported where the point cloud is built, so argument parsing and headless runs do not load it
+
 
 def load_npy_pointcloud(filepath):
     """
@@ -21,7 +23,8 @@ def load_npy_pointcloud(filepath):
         numpy array of shape (N, 3) or (N, 6) where columns are [x, y, z] or [x, y, z, r, g, b]
     """
     try:
-        data = np.load(filepath)
+        # memory mapped, pages are read on demand instead of loading the whole file
+        data = np.load(filepath, mmap_mode='r', allow_pickle=False)
         print(f"Loaded point cloud with shape: {data.shape}")
         print(f"Data type: {data.dtype}")
         
@@ -49,14 +52,17 @@ def create_open3d_pointcloud(points, colors=None):
     Returns:
         open3d.geometry.PointCloud object
     """
+    import open3d as o3d
+
     pcd = o3d.geometry.PointCloud()
-    pcd.points = o3d.utility.Vector3dVector(points)
+    # Open3D stores doubles, so hand it a contiguous float64 buffer directly
+    pcd.points = o3d.utility.Vector3dVector(np.ascontiguousarray(points, dtype=np.float64))
     
     if colors is not None:
-        # Normalize colors to 0-1 range if needed
-        if colors.max() > 1.0:
-            colors = colors / 255.0
-        pcd.colors = o3d.utility.Vector3dVector(colors)
+        # Normalize colors to 0-1 range if needed; uint8 colors always are, without scanning them for the max
+        if colors.dtype == np.uint8 or colors.max() > 1.0:
+            colors = colors / 255.0  # float64 already, so the conversion below does not copy again
+        pcd.colors = o3d.utility.Vector3dVector(np.ascontiguousarray(colors, dtype=np.float64))
     else:
         # Default gray color
         pcd.paint_uniform_color([0.7, 0.7, 0.7])
@@ -84,10 +90,11 @@ def visualize_pointcloud(filepath, show_normals=False, estimate_normals=False,
     if data.shape[1] >= 3:
         points = data[:, :3]
         print(f"Number of points: {points.shape[0]}")
+        mins = points.min(axis=0)
+        maxs = points.max(axis=0)
         print(f"Point cloud bounds:")
-        print(f"  X: [{points[:, 0].min():.2f}, {points[:, 0].max():.2f}]")
-        print(f"  Y: [{points[:, 1].min():.2f}, {points[:, 1].max():.2f}]")
-        print(f"  Z: [{points[:, 2].min():.2f}, {points[:, 2].max():.2f}]")
+        for axis, low, high in zip("XYZ", mins, maxs):
+            print(f"  {axis}: [{low:.2f}, {high:.2f}]")
     else:
         print("Error: Data must have at least 3 columns (x, y, z)")
         sys.exit(1)
@@ -98,6 +105,13 @@ def visualize_pointcloud(filepath, show_normals=False, estimate_normals=False,
         colors = data[:, 3:6]
         print("Colors detected in data")
     
+    # without a display the viewer window cannot open, so no Open3D objects are built at all
+    if sys.platform.startswith("linux") and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")):
+        print("No display available, skipping visualization")
+        return
+
+    import open3d as o3d
+
     # Create Open3D point cloud
     pcd = create_open3d_pointcloud(points, colors)
     
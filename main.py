@@ -13,29 +13,32 @@ from pathlib import Path
 import json
 import time
 
-from BridgeModelGeneration.bridge_pipeline import BridgePipeline
-from PointCloudSimulation.run_simulations import pointcloud_complete_pipeline
-from PointCloudSimulation.convert_to_npy import convert_bridge_data
+# the pipelines pull in cadquery/OCCT, numpy, pandas and numba, so they are imported in the steps
+# that use them and argument parsing (and --help) stays instant
 
 BASE_DIR = Path(__file__).parent
 
 
-def generate_bridges(num_bridges, bridge_type=None, include_components=False):
+def generate_bridges(num_bridges, bridge_type=None, include_components=False, mesh_only=False):
     """Step 1: Generating 3D bridge models
     This will call the BridgePipeline class to generate the bridge models.
-    Use include components to create separate component files (approach_slabs, deck, etc.)."""
+    Use include components to create separate component files (approach_slabs, deck, etc.).
+    Use mesh only to skip the boolean union of the components, HELIOS only needs their surfaces."""
     print(f"\n{'='*70}")
     print(f"STEP 1: Generating {num_bridges} bridge models")
     print(f"{'='*70}\n")
     
     try:
+        from BridgeModelGeneration.bridge_pipeline import BridgePipeline
+
         start_time = time.time()
         pipeline = BridgePipeline(base_dir=str(BASE_DIR))
         bridge_configs, config_json = pipeline.generate_bridges(
             num_bridges=num_bridges,
             bridge_type=bridge_type,
             include_components=include_components,
-            seed=None
+            seed=None,
+            assembly=mesh_only
         )
         print(f"\nSuccessfully generated {num_bridges} bridges")
         end_time = time.time()
@@ -46,19 +49,23 @@ def generate_bridges(num_bridges, bridge_type=None, include_components=False):
         return False
 
 
-def run_helios_simulation(num_bridges, run_simulation=True, run_segmentation=False, npy_conversion=False):
+def run_helios_simulation(num_bridges, run_simulation=True, run_segmentation=False, npy_conversion=False,
+                          segmentation_format='xyz'):
     """Step 2: Runing HELIOS++ simulation to generate point clouds"""
     print(f"\n{'='*70}")
     print(f"STEP 2: Running HELIOS++ simulations")
     print(f"{'='*70}\n")
     
     try:
+        from PointCloudSimulation.run_simulations import pointcloud_complete_pipeline
+
         start_time = time.time()
         pointcloud_complete_pipeline(
             run_simulation=run_simulation,
             num_bridges=num_bridges,
             run_segmentation=run_segmentation,
-            convert_to_npy=npy_conversion
+            convert_to_npy=npy_conversion,
+            segmentation_format=segmentation_format
         )
         print(f"\nSuccessfully completed simulation pipeline")
         end_time = time.time()
@@ -147,11 +154,15 @@ Example
                         help='Type of bridge to generate (default: mixed)')
     parser.add_argument('--include-components', action='store_true',
                         help='Generate separate component files (approach_slabs, deck, etc.)')
+    parser.add_argument('--mesh-only', action='store_true',
+                        help='Export the components as one mesh without fusing them into a single solid (faster)')
     # HELIOS simulation options
     parser.add_argument('--run-simulation', action='store_true',
                         help='Run HELIOS simulation')
     parser.add_argument('--semantic-segmentation', action='store_true',
                         help='Perform semantic segmentation on point clouds')
+    parser.add_argument('--segmentation-format', choices=['xyz', 'npz'], default='xyz',
+                        help='Segmented component files as xyz text or compressed binary npz (default: xyz)')
     # Conversion options
     parser.add_argument('--npy-conversion', action='store_true',
                         help='Convert point clouds to NPY format')
@@ -175,8 +186,10 @@ Example
     print(f"  • Bridges: {args.num_bridges}")
     print(f"  • Bridge type: {args.bridge_type or 'mixed'}")
     print(f"  • Include components: {args.include_components}")
+    print(f"  • Mesh only: {args.mesh_only}")
     print(f"  • Run simulation: {args.run_simulation}")
     print(f"  • Semantic segmentation: {args.semantic_segmentation}")
+    print(f"  • Segmentation format: {args.segmentation_format}")
     print(f"  • Convert to NPY: {args.npy_conversion}")
     print()
     
@@ -184,13 +197,14 @@ Example
     success = True
     
     # Step 1: Generate bridges
-    if not generate_bridges(args.num_bridges, args.bridge_type, args.include_components):
+    if not generate_bridges(args.num_bridges, args.bridge_type, args.include_components, args.mesh_only):
         print("\n❌ Pipeline failed at bridge generation step")
         sys.exit(1)
     
     # Step 2: Run HELIOS simulation (if requested)
     if args.run_simulation:
-        if not run_helios_simulation(args.num_bridges, args.run_simulation, args.semantic_segmentation, args.npy_conversion):
+        if not run_helios_simulation(args.num_bridges, args.run_simulation, args.semantic_segmentation, args.npy_conversion,
+                                     args.segmentation_format):
             print("\n❌ Pipeline failed at HELIOS simulation step")
             sys.exit(1)
         
@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+
+
+def _write_xyz(path, num_rows, ncols=11):
+    rows = np.arange(num_rows * ncols, dtype=np.float32).reshape(num_rows, ncols)
+    np.savetxt(path, rows, fmt='%.1f')
+    return rows
+
+
+@pytest.fixture
+def write_xyz():
+    """ Write num_rows distinct HELIOS-like rows of ncols columns to a .xyz file and return them """
+    return _write_xyz
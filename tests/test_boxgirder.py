@@ -1,37 +1,59 @@
-import logging
-from geometry.bridge_model import BridgeModel
-from BridgeModelGeneration.config import BridgeConfig
-import math
+from dataclasses import replace
+from BridgeModelGeneration.bridge_model import BridgeModel, box_girder_spacing, fast_union
+from BridgeModelGeneration.model_config import BridgeConfig
 import pytest
 
-def test_compute_box_girder_spacing():
-    cfg = BridgeConfig(
+
+@pytest.fixture(scope="module")
+def cfg():
+    return BridgeConfig(
         bridge_id="bridge_test",
         bridge_type="box_girder",
         span_m=30.0,
-        width_m=12.0,
         num_spans = 5,
         total_length_m=150.0,
+        width_m=12.0,
         lanes=3,
-        depth_of_girder=2.0,
         include_sidewalks = False,
-        number_of_piers_per_lane=2,
-        radius_of_pier=1.0,
-        pier_type="circular",
-        pier_cap_type="circular",
+        depth_of_girder=2.0,
+        number_of_piers_along_length=4,
+        number_of_piers_across_width=1,
+        total_piers=4,
+        radius_of_pier=0.6,
+        pier_type="hammer_head",
+        pier_cap_type="prismatic",
         pier_cross_section="circular",
     )
-    
-    model = BridgeModel(cfg)
-    num_of_cells = model.compute_box_girder_spacing(cfg.width_m)
-    assert num_of_cells == 2
-
-    cfg.depth_of_girder = 4.0
-    model = BridgeModel(cfg)
-    num_of_cells = model.compute_box_girder_spacing(cfg.width_m)
-    assert num_of_cells == 1
-
-    cfg.depth_of_girder = 1.0
-    model = BridgeModel(cfg)
-    num_of_cells = model.compute_box_girder_spacing(cfg.width_m)
-    assert num_of_cells == 3
\ No newline at end of file
+
+
+# the 4 m left out of the box width is split over the cells
+@pytest.mark.parametrize("depth, expected", [(2.0, (1, 8.0)), (2.4, (1, 8.0)), (4.0, (1, 8.0)), (1.0, (2, 4.0))])
+def test_box_girder_spacing(cfg, depth, expected):
+    num_of_cells, box_width = box_girder_spacing(cfg.width_m, depth)
+    assert num_of_cells == expected[0]
+    assert box_width == pytest.approx(expected[1])
+
+
+def test_compute_box_girder_spacing_uses_config(cfg):
+    assert BridgeModel(cfg).compute_box_girder_spacing() == box_girder_spacing(cfg.width_m, cfg.depth_of_girder)
+
+
+# one and two cells; the haunches have to run from the outer webs to the deck edges
+@pytest.mark.parametrize("depth", [2.0, 1.0])
+def test_box_girder_deck_is_one_solid_within_the_width(cfg, depth):
+    deck = BridgeModel(replace(cfg, depth_of_girder=depth)).make_box_girder_deck().val()
+    bb = deck.BoundingBox()
+    assert deck.isValid()
+    assert len(deck.Solids()) == 1
+    assert bb.ymin == pytest.approx(-cfg.width_m / 2) and bb.ymax == pytest.approx(cfg.width_m / 2)
+
+
+def test_bridge_union_merges_overlapping_components(cfg):
+    # the rectangular hammer head columns reach into the deck, so the components overlap
+    model = BridgeModel.for_config(replace(cfg, width_m=27.5, depth_of_girder=1.2, pier_cross_section="rectangular",
+                                           number_of_piers_across_width=2, total_piers=8))
+    components, bridge = model.build_bridge(with_components=True)
+    solids = [component.findSolid() for component in components.values()]
+    assert components["deck"].val().intersect(components["piers"].val()).Volume() > 0
+    assert bridge.val().Volume() == pytest.approx(fast_union(solids).val().Volume(), rel=1e-6)
+    assert bridge.val().Volume() < fast_union(solids, glue=True).val().Volume()
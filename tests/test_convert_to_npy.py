@@ -0,0 +1,16 @@
+import numpy as np
+from PointCloudSimulation.convert_to_npy import convert_bridge_files
+
+
+def test_convert_bridge_files(tmp_path, write_xyz):
+    files = [tmp_path / "TLS_1_complete.xyz", tmp_path / "TLS_2_complete.xyz"]
+    for num_rows, path in zip((50, 9000), files):
+        write_xyz(path, num_rows)
+    output_dir = tmp_path / "npy"
+    convert_bridge_files(files, output_dir, max_workers=2, seed=0)
+    for path in files:
+        points = np.load(output_dir / f"{path.stem}.npy")
+        # x, y, z, intensity, classification, always 8192 points with xyz in the unit sphere
+        assert points.shape == (8192, 5)
+        assert points.dtype == np.float32
+        assert np.linalg.norm(points[:, :3], axis=1).max() <= 1 + 1e-5
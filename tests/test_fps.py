@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from PointCloudSimulation.convert_to_npy import (
+    HAVE_NUMBA,
+    _farthest_point_indices,
+    _farthest_point_indices_numpy,
+    farthest_point_sample,
+)
+
+
+@pytest.mark.skipif(not HAVE_NUMBA, reason="numba not installed")
+@pytest.mark.parametrize("n, npoint, start", [(1, 1, 0), (50, 50, 3), (5000, 512, 17)])
+def test_numba_kernel_matches_numpy(n, npoint, start):
+    xyz = np.random.default_rng(0).random((n, 3), dtype=np.float32) * 100
+    expected = _farthest_point_indices_numpy(xyz, npoint, start)
+    np.testing.assert_array_equal(_farthest_point_indices(xyz, npoint, start), expected)
+
+
+def test_farthest_point_sample_is_reproducible():
+    point = np.random.default_rng(1).random((1000, 5), dtype=np.float32)
+    sampled = farthest_point_sample(point, 64, seed=7)
+    assert sampled.shape == (64, 5)
+    assert len(np.unique(sampled, axis=0)) == 64
+    np.testing.assert_array_equal(sampled, farthest_point_sample(point, 64, seed=7))
@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from BridgeModelGeneration.bridge_model import _pier_stations
+
+
+def baseline_pier_stations(num_spans, total_length_m):
+    # the original BridgeModel.compute_pier_positions_along_length
+    interior_span_length = round(total_length_m / (num_spans - 0.6), 1)
+    end_span_length = round(interior_span_length * 0.7, 1)
+    spans = [end_span_length] + [interior_span_length] * (num_spans - 2) + [end_span_length]
+    pier_positions = []
+    pos = 0.0
+    for span in spans[:-1]:
+        pos += span
+        pier_positions.append(round(pos, 1))
+    return [round(p - (total_length_m / 2), 1) for p in pier_positions]
+
+
+@pytest.mark.parametrize("num_spans", [2, 3, 4, 5])
+def test_pier_stations_match_baseline(num_spans):
+    for total_length_m in np.arange(20.0, 200.5, 0.5):
+        stations = _pier_stations(num_spans, float(total_length_m))
+        assert stations.tolist() == baseline_pier_stations(num_spans, float(total_length_m)), total_length_m
+
+
+def test_pier_stations_five_spans_90m():
+    assert _pier_stations(5, 90.0).tolist() == [-30.7, -10.2, 10.3, 30.8]
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+from PointCloudSimulation.convert_to_npy import sample_points
+
+
+@pytest.mark.parametrize("num_rows, k", [(5, 16), (16, 16), (100, 16)])
+def test_sample_size_and_rows(tmp_path, write_xyz, num_rows, k):
+    rows = write_xyz(tmp_path / "scan.xyz", num_rows)
+    sample, seen = sample_points(tmp_path / "scan.xyz", k=k, chunksize=7, rng=np.random.default_rng(0))
+    assert seen == num_rows
+    assert sample.shape == (min(num_rows, k), rows.shape[1])
+    # every sampled row is a distinct row of the file
+    assert len({tuple(row) for row in sample}) == len(sample)
+    assert {tuple(row) for row in sample} <= {tuple(row) for row in rows}
+
+
+def test_sample_is_reproducible(tmp_path, write_xyz):
+    write_xyz(tmp_path / "scan.xyz", 100)
+    first, _ = sample_points(tmp_path / "scan.xyz", k=16, chunksize=7, rng=np.random.default_rng(42))
+    second, _ = sample_points(tmp_path / "scan.xyz", k=16, chunksize=7, rng=np.random.default_rng(42))
+    np.testing.assert_array_equal(first, second)
+
+
+def test_bin_sample_size(tmp_path):
+    rows = np.arange(100 * 11, dtype=np.float32).reshape(100, 11)
+    rows.tofile(tmp_path / "scan.bin")
+    sample, seen = sample_points(tmp_path / "scan.bin", k=16, rng=np.random.default_rng(0))
+    assert seen == 100
+    assert sample.shape == (16, 11)
+
+
+@pytest.mark.parametrize("content", ["", "\n\n"])
+def test_empty_file_raises(tmp_path, content):
+    (tmp_path / "empty.xyz").write_text(content)
+    with pytest.raises(ValueError, match="no points"):
+        sample_points(tmp_path / "empty.xyz")
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from PointCloudSimulation.semantic_segmentation import (
+    COMPONENT_NAMES,
+    _bucket_by_id,
+    _bucket_by_id_numpy,
+    merge_and_segment,
+)
+
+
+def _leg_line(x, component_id):
+    # HELIOS xyz row, the hit object id is the 9th column
+    return f"{x:.4f} {x + 1:.4f} {x + 2:.4f} 1.0 0.0 1 1 0 {component_id} 0.0"
+
+
+@pytest.fixture
+def leg_files(tmp_path):
+    legs = [[_leg_line(0, 2), _leg_line(1, 3), "", _leg_line(2, 2)],
+            [_leg_line(3, 3), _leg_line(4, 0)]]
+    files = []
+    for i, leg in enumerate(legs):
+        leg_file = tmp_path / f"leg{i:03d}_points.xyz"
+        leg_file.write_text("\n".join(leg) + "\n")
+        files.append(leg_file)
+    return files
+
+
+def test_merge_and_segment_xyz(tmp_path, leg_files):
+    out_dir = tmp_path / "segmented"
+    out_dir.mkdir()
+    num_points, counts = merge_and_segment(leg_files, tmp_path / "merged.xyz", out_dir, fmt="xyz")
+
+    assert num_points == 5
+    assert counts == {0: 1, 2: 2, 3: 2}
+    merged = (tmp_path / "merged.xyz").read_text().splitlines()
+    assert merged == [_leg_line(x, c) for x, c in [(0, 2), (1, 3), (2, 2), (3, 3), (4, 0)]]
+    assert (out_dir / f"{COMPONENT_NAMES[2]}.xyz").read_text().splitlines() == [_leg_line(0, 2), _leg_line(2, 2)]
+    assert (out_dir / f"{COMPONENT_NAMES[3]}.xyz").read_text().splitlines() == [_leg_line(1, 3), _leg_line(3, 3)]
+    assert sorted(p.name for p in out_dir.iterdir()) == sorted(f"{COMPONENT_NAMES[c]}.xyz" for c in counts)
+
+
+def test_merge_and_segment_npz(tmp_path, leg_files):
+    out_dir = tmp_path / "segmented"
+    out_dir.mkdir()
+    _, counts = merge_and_segment(leg_files, tmp_path / "merged.xyz", out_dir, fmt="npz")
+
+    assert counts == {0: 1, 2: 2, 3: 2}
+    with np.load(out_dir / f"{COMPONENT_NAMES[3]}.npz") as data:
+        np.testing.assert_allclose(data["xyz"], [[1, 2, 3], [3, 4, 5]])
+        assert data["xyz"].dtype == np.float32
+        np.testing.assert_array_equal(data["ids"], [3, 3])
+
+
+def test_merge_and_segment_without_segmentation(tmp_path, leg_files):
+    num_points, counts = merge_and_segment(leg_files, tmp_path / "merged.xyz")
+    assert num_points == 5
+    assert counts == {}
+
+
+def test_numpy_buckets_match_counting_sort():
+    component_ids = np.random.default_rng(0).integers(0, 6, 1000)
+    for expected, actual in zip(_bucket_by_id(component_ids, 7), _bucket_by_id_numpy(component_ids, 7)):
+        np.testing.assert_array_equal(actual, expected)